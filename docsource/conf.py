@@ -6,24 +6,12 @@
 
 # -- Path setup --------------------------------------------------------------
 
-# If extensions (or modules to document with autodoc) are in another directory,
-# add these directories to sys.path here. If the directory is relative to the
-# documentation root, use os.path.abspath to make it absolute, like shown here.
+# The API reference is generated by `sphinx-autoapi`, which parses the source
+# statically; `selprotopy` does not need to be importable to build the docs.
 #
 import os
 import sys
 print("Build with:", sys.version)
-parent_dir = os.path.dirname(os.path.dirname(__file__))
-sys.path.insert(0,parent_dir)
-print(parent_dir)
-
-
-# Verify Import
-try:
-    import selprotopy
-except:
-    print("Couldn't import `selprotopy` module!")
-    sys.exit(9)
 
 
 # -- Project information -----------------------------------------------------
@@ -39,16 +27,19 @@ author = 'Joe Stanley'
 # extensions coming with Sphinx (named 'sphinx.ext.*') or your custom
 # ones.
 extensions = [
-    'sphinx.ext.autodoc',
     'sphinx.ext.napoleon',
-    'sphinx.ext.autosummary',
-    'numpydoc',
+    'autoapi.extension',
     #'sphinx_sitemap',
     'myst_parser',
     'sphinx_immaterial',
 ]
-autosummary_generate = True
-numpydoc_show_class_members = True
+
+# Document the Package Source (not the `__init__.pyi` type stub)
+autoapi_type = 'python'
+autoapi_dirs = ['../selprotopy']
+autoapi_file_patterns = ['*.py']
+autoapi_keep_files = True
+autoapi_add_toctree_entry = False
 
 
 # List of patterns, relative to source directory, that match files and
@@ -107,7 +98,37 @@ html_theme_options = {
 }
 
 
+# -- Incremental Build Support -----------------------------------------------
+
+# `sphinx-autoapi` rewrites every generated page on each build, which bumps
+# their modification times and makes Sphinx re-read all of them. Pages whose
+# content did not change get their previous modification time restored so the
+# cached doctrees are reused.
+AUTOAPI_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'autoapi')
+_generated_pages = {}
+
+def _read_generated_page(path):
+    with open(path, 'rb') as page:
+        return page.read()
+
+def _snapshot_generated_pages(app, config):
+    for dirpath, _, filenames in os.walk(AUTOAPI_ROOT):
+        for filename in filenames:
+            path = os.path.join(dirpath, filename)
+            _generated_pages[path] = (
+                _read_generated_page(path),
+                os.stat(path).st_mtime_ns,
+            )
+
+def _restore_unchanged_pages(app):
+    for path, (content, mtime_ns) in _generated_pages.items():
+        if os.path.exists(path) and _read_generated_page(path) == content:
+            os.utime(path, ns=(mtime_ns, mtime_ns))
 
+def setup(app):
+    app.connect('config-inited', _snapshot_generated_pages)
+    # Run After `sphinx-autoapi` Generates Pages (default priority is 500)
+    app.connect('builder-inited', _restore_unchanged_pages, priority=900)
 
 
-# END
\ No newline at end of file
+# END
@@ -17,13 +17,59 @@ SEL Protocol Application Guide: https://selinc.com/api/download/5026/
 ################################################################################
 
 # Standard Imports
-import telnetlib
-
-# Local Imports
-from selprotopy.support import telnet
+import os
+import importlib
 
 # Describe Package for External Interpretation
 __version__ = "0.1.4"
 
-# `telnetlib` Discards Null Characters, but SEL Protocol Requires them
-telnetlib.Telnet.process_rawq = telnet.process_rawq
+# Public Names Resolved on First Access: name -> (module, attribute)
+_LAZY_IMPORTS = {
+    "SELClient":        ("selprotopy.client.base", "SELClient"),
+    "TCPSELClient":     ("selprotopy.client.ethernet", "TCPSELClient"),
+    "SerialSELClient":  ("selprotopy.client.serial", "SerialSELClient"),
+    "AsyncSELClient":   ("selprotopy.client.aio", "AsyncSELClient"),
+    "TelnetSocket":     ("selprotopy.support.socket", "TelnetSocket"),
+    "SELTelnet":        ("selprotopy.support.telnet", "SELTelnet"),
+    "client":           ("selprotopy.client", None),
+    "exceptions":       ("selprotopy.exceptions", None),
+    "commands":         ("selprotopy.protocol.commands", None),
+    "parser":           ("selprotopy.protocol.parser", None),
+    "telnet":           ("selprotopy.support.telnet", None),
+}
+
+
+# Optional Dependencies, by Module Name; Members Needing them Load Only on Use
+_OPTIONAL_DEPENDENCIES = {"serial"}
+
+
+def __getattr__(name: str):
+    """Import Public Package Members on First Access."""
+    try:
+        module_name, attribute = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+    value = importlib.import_module(module_name)
+    if attribute:
+        value = getattr(value, attribute)
+    # Cache the Result so Later Access Skips this Hook
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """List Package Members, Including those not yet Imported."""
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+
+# Resolve Everything Up-Front when Requested (Useful to Catch Breakage in CI)
+if os.environ.get("SELPROTOPY_EAGER_IMPORT") == "1":
+    for _name in _LAZY_IMPORTS:
+        try:
+            __getattr__(_name)
+        except ModuleNotFoundError as _error:
+            # Skip Members whose Optional Dependency (e.g. pySerial) is Missing
+            if _error.name not in _OPTIONAL_DEPENDENCIES:
+                raise
@@ -0,0 +1,17 @@
+################################################################################
+# Type Stub for `selprotopy`: Members Listed Here are Imported Lazily at Runtime
+################################################################################
+
+from selprotopy import client as client
+from selprotopy import exceptions as exceptions
+from selprotopy.client.base import SELClient as SELClient
+from selprotopy.client.ethernet import TCPSELClient as TCPSELClient
+from selprotopy.client.serial import SerialSELClient as SerialSELClient
+from selprotopy.client.aio import AsyncSELClient as AsyncSELClient
+from selprotopy.protocol import commands as commands
+from selprotopy.protocol import parser as parser
+from selprotopy.support import telnet as telnet
+from selprotopy.support.socket import TelnetSocket as TelnetSocket
+from selprotopy.support.telnet import SELTelnet as SELTelnet
+
+__version__: str
@@ -16,12 +16,11 @@ SEL Protocol Application Guide: https://selinc.com/api/download/5026/
 """
 ################################################################################
 
-try:
-    from selprotopy.client.serial import *
-except ImportError:
-    pass
+from selprotopy.client.ethernet import *
+from selprotopy.client.aio import *
 
+# pySerial is an Optional Dependency
 try:
-    from selprotopy.client.ethernet import *
+    from selprotopy.client.serial import *
 except ImportError:
     pass
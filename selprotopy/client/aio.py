@@ -0,0 +1,661 @@
+################################################################################
+"""
+selprotopy: A Protocol Binding Suite for the SEL Protocol Suite.
+
+Supports:
+    - SEL Fast Meter
+    - SEL Fast Message
+    - SEL Fast Operate
+
+Author(s):
+    - Joe Stanley: engineerjoe440@yahoo.com
+
+Homepage: https://github.com/engineerjoe440/sel-proto-py
+
+SEL Protocol Application Guide: https://selinc.com/api/download/5026/
+"""
+################################################################################
+
+# Standard Imports
+import asyncio
+import logging
+import functools
+from typing import Iterable
+
+# Local Imports
+from selprotopy.common import (
+    debug_print, RemoteBitControlType, BreakerBitControlType,
+)
+from selprotopy import exceptions
+from selprotopy.protocol import commands, parser
+from selprotopy.support.socket import TelnetDecoder, IAC, tune_socket
+from selprotopy.client.shared import SELClientMixin, parse_pool
+
+__all__ = ["AsyncSELClient"]
+
+
+# Define Asynchronous Polling Client
+class AsyncSELClient(SELClientMixin):
+    """
+    `AsyncSELClient` Class for Polling an SEL Relay/Intelligent Electronic Device.
+
+    The asynchronous polling class intended to interact with an SEL relay's
+    telnet server by way of `asyncio` streams. Requests which do not depend on
+    one another are written back-to-back and their responses are read in
+    order, so the auto-configuration process costs few network round-trips.
+    Many relays may be polled concurrently with `asyncio.gather`.
+
+    Use `AsyncSELClient.connect` to open the connection, verify and
+    (optionally) auto-configure the client.
+
+    Examples
+    --------
+    >>> async def main():
+    ...     clients = await AsyncSELClient.connect_many(
+    ...         ['192.168.2.210', '192.168.2.211'], autoconfig=True
+    ...     )
+    ...     return await asyncio.gather(
+    ...         *(client.poll_fast_meter() for client in clients.values())
+    ...     )
+
+    Parameters
+    ----------
+    reader:             asyncio.StreamReader
+                        Stream from which the relay's responses are read.
+    writer:             asyncio.StreamWriter
+                        Stream to which requests to the relay are written.
+    logger:             logging.logger
+                        Logging object to record communications messages.
+    verbose:            bool, optional
+                        Control to dictate whether verbose printing operations
+                        should be used (often for debugging and learning
+                        purposes). Defaults to False
+    timeout:            float, optional
+                        Time (in seconds) to wait for the relay's response to
+                        any single request. Defaults to 60
+    verify_timeout:     float, optional
+                        Time (in seconds) to wait for the relay's prompt while
+                        verifying the connection. Defaults to `timeout`
+    conn_check:         int, optional
+                        Maximum number of attempts to obtain a clean prompt
+                        (each requesting three prompts) before giving up.
+                        Defaults to 5
+    cmd_delay:          float, optional
+                        Time (in seconds) used to pace password entry and to
+                        collect trailing prompt characters. Defaults to 0.025
+    prompt_retries:     int, optional
+                        Number of consecutive empty reads (each limited by
+                        `timeout`) tolerated while waiting for a command's
+                        response before giving up. Defaults to 3
+
+    Attributes
+    ----------
+    fid:        str
+                Relay's described Firmware ID string (set by connection with
+                relay)
+    bfid:       str
+                Relay's described BFID string (set by connection with relay)
+    cid:        str
+                Relay's described CID string (set by connection with relay)
+    devid:      str
+                Relay's described DEVID string (set by connection with relay)
+    partno:     str
+                Relay's described part number string (set by connection with
+                relay)
+    config:     str
+                Relay's described configuration string (set by connection with
+                relay)
+    """
+
+    # Fixed Attribute Layout (subclasses should declare their own `__slots__`)
+    __slots__ = ('reader', 'writer', '_decoder')
+
+    def __init__(self, reader: asyncio.StreamReader,
+                 writer: asyncio.StreamWriter, logger: logging.Logger = None,
+                 verbose: bool = False, debug: bool = False,
+                 timeout: float = 60, conn_check: int = 5,
+                 cmd_delay: float = 0.025, prompt_retries: int = 3,
+                 verify_timeout: float = None):
+        """Prepare AsyncSELClient."""
+        # Initialize Inputs
+        self.reader = reader
+        self.writer = writer
+        self._decoder = TelnetDecoder()
+
+        # Initialize Class Options and Reset the Relay's Description
+        self._init_shared_state(
+            logger=logger, verbose=verbose, debug=debug, timeout=timeout,
+            conn_check=conn_check, cmd_delay=cmd_delay,
+            prompt_retries=prompt_retries, verify_timeout=verify_timeout,
+        )
+
+    @classmethod
+    async def connect(cls, host: str, port: int = 23, noverify: bool = False,
+                      autoconfig: bool = False, nodelay: bool = True,
+                      **kwargs):
+        """
+        Open a Connection to a Relay and Prepare the Client.
+
+        Parameters
+        ----------
+        host:       str
+                    Host name or IP address of the relay.
+        port:       int, optional
+                    TCP port of the relay's telnet server, defaults to 23.
+        noverify:   bool, optional
+                    Control to skip verification of the connection.
+                    Defaults to False
+        autoconfig: bool, optional
+                    Control to run the auto-configuration process once
+                    connected. Defaults to False
+        nodelay:    bool, optional
+                    Control to disable Nagle's algorithm on the connection.
+                    Defaults to True
+        **kwargs:   Additional keyword arguments passed to `AsyncSELClient`.
+
+        Returns
+        -------
+        AsyncSELClient: The connected client.
+        """
+        reader, writer = await asyncio.open_connection(host, port)
+        tune_socket(writer.get_extra_info('socket'), nodelay)
+        client = cls(reader, writer, **kwargs)
+        try:
+            if not noverify:
+                if client.verbose:
+                    debug_print('Verifying Connection...')
+                if not await client._verify_connection():
+                    raise exceptions.ConnVerificationFail(
+                        "Verification Failed: relay did not respond with a "
+                        f"prompt within {client._verify_timeout:.3f}s."
+                    )
+                if client.verbose:
+                    debug_print('Connection Verified.')
+            await client.quit()
+            if autoconfig:
+                await client.autoconfig(verbose=client.verbose)
+        except BaseException:
+            await client.close()
+            raise
+        return client
+
+    @classmethod
+    async def connect_many(cls, endpoints: Iterable,
+                           return_exceptions: bool = False, **kwargs):
+        """
+        Connect to (and Prepare) Many Relays Concurrently.
+
+        Every relay's handshake is awaited together, so the time taken is
+        that of the slowest relay rather than the sum across all relays.
+
+        Parameters
+        ----------
+        endpoints:          iterable
+                            Relays to connect to, each given as a host name
+                            (using port 23) or a `(host, port)` pair.
+        return_exceptions:  bool, optional
+                            Control to return the exception raised for a relay
+                            in place of its client, rather than raising it
+                            once all relays have been attempted. Defaults to
+                            False
+        **kwargs:           Additional keyword arguments passed to `connect`.
+
+        Returns
+        -------
+        dict:               Clients keyed by the endpoints given.
+        """
+        endpoints = list(dict.fromkeys(endpoints))
+        results = await asyncio.gather(
+            *(
+                cls.connect(
+                    *((endpoint,) if isinstance(endpoint, str) else endpoint),
+                    **kwargs
+                )
+                for endpoint in endpoints
+            ),
+            return_exceptions=True
+        )
+        clients = dict(zip(endpoints, results))
+        if return_exceptions:
+            return clients
+        failure = next(
+            (result for result in results
+             if isinstance(result, BaseException)),
+            None
+        )
+        if failure is not None:
+            # Close the Connected Clients, Which would Otherwise be Left Open
+            await asyncio.gather(*(
+                client.close() for client in results
+                if not isinstance(client, BaseException)
+            ))
+            raise failure
+        return clients
+
+    async def close(self):
+        """Close the Connection."""
+        self.writer.close()
+        try:
+            await self.writer.wait_closed()
+        except ConnectionError:
+            pass
+
+    async def __aenter__(self):
+        """Enter Context."""
+        return self
+
+    async def __aexit__(self, *args):
+        """Close Connection when Leaving Context."""
+        await self.close()
+
+    # Define Method to Perform the I/O Requested by Shared Steps (see
+    # `SELClientMixin`), Returning the Result of the Exchange
+    async def _run(self, steps):
+        result = None
+        while True:
+            try:
+                operation, *args = steps.send(result)
+            except StopIteration as done:
+                return done.value
+            result = await getattr(self, operation)(*args)
+
+    # Define Method to Write, Escaping the Telnet IAC Character
+    def _write(self, data: bytes):
+        if self.logger and self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug('Tx: %s', data)
+        if IAC in data:
+            data = data.replace(IAC, IAC + IAC)
+        self.writer.write(data)
+
+    # Define Method to Send a Request
+    async def _send(self, data: bytes):
+        self._write( data )
+        await self.writer.drain()
+
+    # Define Method to Receive a Chunk of Data into the Decoder
+    async def _fill(self):
+        data = await self.reader.read(65536)
+        if not data:
+            return False
+        replies = self._decoder.feed(data)
+        if replies:
+            self.writer.write(replies)
+        return True
+
+    # Define Method to Read Through a Byte-String
+    async def _read_until(self, match: bytes):
+        decoder = self._decoder
+        scan_from = 0
+        while True:
+            data = decoder.take_until(match, scan_from)
+            if data is not None:
+                return data
+            scan_from = max(0, len(decoder.cooked) - len(match) + 1)
+            if not await self._fill():
+                return decoder.take(len(decoder.cooked))
+
+    # Define Method to Read All Data to Next Relay Prompt
+    async def _read_to_prompt(self, prompt_str=commands.PROMPT, timeout=None):
+        if timeout is None:
+            timeout = self.timeout
+        try:
+            response = await asyncio.wait_for(
+                self._read_until(prompt_str),
+                timeout=timeout
+            )
+        except asyncio.TimeoutError:
+            # Provide whatever Arrived, as `telnetlib` Would
+            response = self._decoder.take(len(self._decoder.cooked))
+        if self.logger and self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug('Rx: %s', response)
+        self._debug_print(response)
+        return response
+
+    # Define Method to Collect Data Arriving Shortly After a Response
+    async def _read_eager(self, timeout=None):
+        if timeout is None:
+            timeout = self.__inter_cmd_delay__
+        try:
+            await asyncio.wait_for(self._fill(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+        return self._decoder.take(len(self._decoder.cooked))
+
+    # Define Method to Read All Data After a Command (and to next relay prompt)
+    async def _read_command_response(self, command,
+                                     prompt_str=commands.PROMPT):
+        return await self._run(
+            self._command_response_steps(command, prompt_str)
+        )
+
+    # Define Connectivity Check Method
+    async def _verify_connection(self):
+        self._write( commands.CR3 )
+        await self.writer.drain()
+        response = await self._read_to_prompt(
+            commands.LEVEL_0,
+            timeout=self._verify_timeout
+        )
+        return commands.LEVEL_0 in response
+
+    # Define Method to Read Until a "Clean" Prompt is Viewed
+    async def _read_clean_prompt(self):
+        await self._run(self._clean_prompt_steps())
+
+    # Define Method to "Clear" the Buffer
+    async def _clear_input_buffer(self):
+        resp = await self._read_eager()
+        while resp:
+            self._debug_print('Clearing buffer:', resp)
+            resp = await self._read_eager()
+
+    # Define Method to Identify Current Access Level
+    async def access_level(self, refresh: bool = False):
+        """
+        Identify Current Access Level.
+
+        Simple method to identify what the current access level
+        is for the connected relay. Provides an integer and
+        string. A level observed or entered by this client within the
+        last `ACCESS_LEVEL_TTL` seconds is returned without asking
+        the relay again.
+
+        Parameters
+        ----------
+        refresh:    bool, optional
+                    Control to always ask the relay for its access level,
+                    defaults to False.
+
+        Returns
+        -------
+        int:    Integer representing the access level
+                as a value in the range of [0, 1, 2, 3]
+        desc:   String describing the access level,
+                will return empty string for level-0.
+        """
+        return await self._run(self._access_level_steps(refresh))
+
+    # Define Method to Return to Access Level 0
+    async def quit(self):
+        """
+        Quit Method.
+
+        Simple method to send the QUIT command to an
+        actively connected relay.
+        """
+        await self._run(self._quit_steps())
+
+    # Define Method to Access Level 1
+    async def access_level_1(self, level_1_pass: bytes = commands.PASS_ACC,
+                             **kwargs):
+        """
+        Go to Access Level 1.
+
+        Used to elevate connection privileges with the connected
+        relay to ACC with the appropriate password specified.
+
+        Parameters
+        ----------
+        level_1_pass:       bytes, optional
+                            Password necessary to access the ACC
+                            level, only required if accessing ACC
+                            from level 0 (i.e. logging in).
+
+        Returns
+        -------
+        success:            bool
+                            Indicator of whether the login failed.
+        """
+        return await self._run(self._access_level_1_steps(level_1_pass))
+
+    # Define Method to Access Level 2
+    async def access_level_2(self, level_2_pass: bytes = commands.PASS_2AC,
+                             **kwargs):
+        """
+        Go To Access Level 2.
+
+        Used to elevate connection privileges with the connected
+        relay to 2AC with the appropriate password specified.
+
+        Parameters
+        ----------
+        level_2_pass:       bytes, optional
+                            Password necessary to access the 2AC
+                            level, only required if accessing 2AC
+                            from level 1 (i.e. logging in).
+
+        Returns
+        -------
+        success:            bool
+                            Indicator of whether the login failed.
+        """
+        return await self._run(
+            self._access_level_2_steps(level_2_pass, **kwargs)
+        )
+
+    # Define Method to Perform Auto-Configuration Process
+    async def autoconfig(self, verbose: bool = False, **kwargs):
+        """
+        Auto-Configure AsyncSELClient Instance.
+
+        Method to operate the standard auto-configuration process
+        with a connected relay to identify the system parameters of
+        the relay, following the same request sequence as
+        `SELClient.autoconfig`. Requests are issued in three pipelined
+        stages:
+
+        1. Relay Definition Block and ID Block
+        2. Each supported Fast Meter and Fast Operate Configuration Block
+        3. DNA Block (after elevating to access level 1)
+
+        A malformed block is requested once more on its own.
+
+        Parameters
+        ----------
+        verbose:        bool, optional
+                        Control to dictate whether verbose printing operations
+                        should be used (often for debugging and learning
+                        purposes). Defaults to False
+        """
+        await self.quit()
+        self._config_responses = {}
+        # Request Relay Definition and ID Blocks Together
+        if not await self._run(self._definition_and_id_steps(verbose=verbose)):
+            # Request a Malformed Definition Block Again, on its Own
+            await self._send( commands.RELAY_DEFINITION_REQUEST )
+            await self._run(self._relay_definition_steps(verbose=self.debug))
+        # Request the Configuration Blocks, then the DNA Block
+        malformed = await self._run(self._configuration_steps(
+            verbose, **kwargs
+        ))
+        requests = dict(self._configuration_requests())
+        for name in malformed:
+            # Request a Malformed Block Again, on its Own
+            await self._run(self._configuration_block_steps(
+                name, requests[name], verbose=self.debug
+            ))
+
+    # Define Method to Perform Fast Meter Polling
+    async def poll_fast_meter(self, minAccLevel: int = 0,
+                              verbose: bool = False, **kwargs):
+        """
+        Poll Fast Meter Data from SEL Relay/IED.
+
+        Method to poll the connected relay with the configured protocol
+        settings (use `autoconfig` method to configure protocol settings).
+
+        Parameters
+        ----------
+        minAccLevel:    int, optional
+                        Control to specify whether a minimum access level must
+                        be obtained before polling should be performed.
+        verbose:        bool, optional
+                        Control to dictate whether verbose printing operations
+                        should be used (often for debugging purposes).
+                        Defaults to False
+        """
+        # Verify that Configuration is Valid
+        if self.fast_meter_definition is None:
+            raise ValueError("Client has not been auto-configured yet!")
+        # Raise to Appropriate Access Level if Needed
+        if minAccLevel == 1:
+            await self.access_level_1( **kwargs )
+        if minAccLevel == 2:
+            await self.access_level_2( **kwargs )
+        # Poll Client for Data
+        fm_command = self._fm[0][1]
+        self._write( self._fm_requests[0] )
+        await self.writer.drain()
+        return parser.fast_meter_block(
+            await self._read_command_response( fm_command ),
+            self.fast_meter_definition,
+            self.dnaDef,
+            verbose=verbose,
+        )
+
+    # Define Method to Poll Fast Meter Data Periodically
+    async def stream_fast_meter(self, period: float = 1.0, count: int = None,
+                                verbose: bool = False):
+        """
+        Poll Fast Meter Data from SEL Relay/IED Periodically.
+
+        Asynchronous generator which polls the relay once every `period`
+        seconds, yielding each parsed response. Polls are scheduled against a
+        fixed clock, and responses are parsed on a worker thread; when the
+        next poll is already due, its request is sent before the previous
+        response is parsed, so parsing overlaps the next round-trip.
+
+        Parameters
+        ----------
+        period:         float, optional
+                        Time (in seconds) between the start of each poll.
+                        Defaults to 1.0
+        count:          int, optional
+                        Number of polls to perform, polls until the generator
+                        is closed when not specified.
+        verbose:        bool, optional
+                        Control to dictate whether verbose printing operations
+                        should be used (often for debugging purposes).
+                        Defaults to False
+
+        Yields
+        ------
+        dict:           Parsed Fast Meter response (as from
+                        `poll_fast_meter`).
+
+        Examples
+        --------
+        >>> async for data in client.stream_fast_meter(period=1.0, count=10):
+        ...     print(data['analogs'])
+        """
+        # Verify that Configuration is Valid
+        if self.fast_meter_definition is None:
+            raise ValueError("Client has not been auto-configured yet!")
+        loop = asyncio.get_running_loop()
+        fm_command = self._fm[0][1]
+        request = self._fm_requests[0]
+        polled = 0
+        next_poll = loop.time()
+        self._write( request )
+        await self.writer.drain()
+        while True:
+            response = await self._read_command_response( fm_command )
+            polled += 1
+            more = count is None or polled < count
+            next_poll = max(next_poll + period, loop.time() - period)
+            # Send the Next Request Now if it is Already Due
+            in_flight = more and loop.time() >= next_poll
+            if in_flight:
+                self._write( request )
+                await self.writer.drain()
+            data = await loop.run_in_executor(parse_pool(), functools.partial(
+                parser.fast_meter_block, response, self.fast_meter_definition,
+                self.dnaDef, verbose=verbose
+            ))
+            try:
+                yield data
+            except GeneratorExit:
+                # Consume the Outstanding Response so the Client Stays Usable
+                if in_flight:
+                    await self._read_command_response( fm_command )
+                raise
+            if not more:
+                return
+            if not in_flight:
+                await asyncio.sleep( next_poll - loop.time() )
+                self._write( request )
+                await self.writer.drain()
+
+    # Define Method to Send Fast Operate Command for Breaker Bit
+    async def send_breaker_bit_fast_op(
+        self,
+        control_point: str,
+        command: BreakerBitControlType = BreakerBitControlType.TRIP
+    ):
+        """
+        Send a Fast Operate Breaker Bit Control.
+
+        Parameters
+        ----------
+        control_point:  str
+                        Particular Remote Bit point which should be
+                        controlled, should be of format 'RBxx' where
+                        'xx' represents the remote bit number.
+        command:        BreakerBitControlType, optional
+                        Command type which will be sent, must be of:
+                        ['TRIP', 'CLOSE'].
+                        Defaults to 'trip'
+        """
+        command_str = self._prepare_fastop_command(
+            'breaker_bit', control_point, command
+        )
+        if self.verbose:
+            debug_print(command_str)
+        self._write( command_str )
+        await self.writer.drain()
+
+    # Define Method to Send Fast Operate Command for Remote Bit
+    async def send_remote_bit_fast_op(
+        self,
+        control_point: str,
+        command: RemoteBitControlType = RemoteBitControlType.PULSE
+    ):
+        """
+        Send a Fast Operate Remote Bit Control.
+
+        Parameters
+        ----------
+        control_point:  str
+                        Particular Remote Bit point which should be
+                        controlled, should be of format 'RBxx' where
+                        'xx' represents the remote bit number.
+        command:        RemoteBitControlType, optional
+                        Command type which will be sent, must be of:
+                        ['SET', 'CLEAR', 'PULSE', 'OPEN', 'CLOSE'].
+                        Defaults to 'pulse'
+        """
+        command_str = self._prepare_fastop_command(
+            'remote_bit', control_point, command
+        )
+        if self.verbose:
+            debug_print(command_str)
+        self._write( command_str )
+        await self.writer.drain()
+
+
+if __name__ == '__main__':
+    async def main():
+        """Poll a Relay for Ten Fast Meter Samples, One Second Apart."""
+        print('Establishing Connection...')
+        client = await AsyncSELClient.connect(
+            '192.168.2.210', autoconfig=True, verbose=True
+        )
+        async with client:
+            async for data in client.stream_fast_meter(period=1.0, count=10):
+                for name, value in data['analogs'].items():
+                    print(name, value)
+
+    asyncio.run(main())
+
+
+# END
@@ -18,19 +18,47 @@ SEL Protocol Application Guide: https://selinc.com/api/download/5026/
 
 # Standard Imports
 import time
+import select
 import logging
+import functools
+import selectors
 
 # Local Imports
 from selprotopy.common import (
-    retry, INVALID_COMMAND_STR, RemoteBitControlType, BreakerBitControlType
+    retry, debug_print, RemoteBitControlType, BreakerBitControlType,
 )
 from selprotopy import exceptions
 from selprotopy.protocol import commands, parser
-from selprotopy.support import socket
+from selprotopy.support import socket, cache
+from selprotopy.client.shared import (
+    CONFIGURATION_BLOCKS, SELClientMixin, parse_relay_definition,
+    parse_relay_dna,
+)
+
+
+# Identification which must Match for Cached Configuration to be Reused: the
+# Relay's Firmware (FID, BFID), Settings (CID), and Hardware (PARTNO, CONFIG)
+def _cache_identity(client):
+    return [client.fid, client.bfid, client.cid, client.partno, client.config]
+
+
+# Identify the Relay a Connection is Attached to, for Caching its Configuration
+def _endpoint_key(conn):
+    sock = conn.get_socket() if hasattr(conn, 'get_socket') else conn
+    if hasattr(sock, 'getpeername'):
+        host, port = sock.getpeername()[:2]
+        return f'{host}_{port}'
+    # pySerial
+    return str(conn.port)
+
+
+# Raw Configuration Responses Gathered in this Process, by Relay Identification;
+# Later Connections to Identical Relays Reuse them Rather than Requesting them
+_CONFIGURATION_MEMO = {}
 
 
 # Define Simple Polling Client
-class SELClient():
+class SELClient(SELClientMixin):
     """
     `SELClient` Class for Polling an SEL Relay/Intelligent Electronic Device.
 
@@ -41,31 +69,68 @@ class SELClient():
     - telnetlib     https://docs.python.org/3/library/telnetlib.html
     - pyserial      https://pyserial.readthedocs.io/en/latest/pyserial.html
 
+    A `selprotopy.support.socket.TelnetSocket` may be used in place of
+    `telnetlib`, which is deprecated; a `telnetlib.Telnet` connection is
+    taken over by one automatically.
+
     Parameters
     ----------
     connApi:            [telnetlib.Telnet, serial.Serial]
                         Telnet or Serial API which will be used to communicate
                         with the SEL relay.
-    autoconfig_now:     bool, optional
+    autoconfig:         bool, optional
                         Control to activate automatic configuration with the
-                        connected relay at time of class initialization, this
-                        should normally be set to True to allow auto-config.
-                        Defaults to True
-    validConnChecks:    int, optional
-                        Integer control to indicate maximum number of
-                        connection attempts should be issued to relay in the
-                        process of verifying established connection(s).
-                        Defaults to 5
-    interdelay:         float, optional
-                        Floating control which describes the amount of time in
-                        seconds between iterative connection verification
-                        attempts. Defaults to 0.025 (seconds)
+                        connected relay at time of class initialization.
+                        Defaults to False
+    noverify:           bool, optional
+                        Control to skip verification of the connection.
+                        Defaults to False
+    timeout:            float, optional
+                        Time (in seconds) to wait for the relay's response to
+                        any single request. Defaults to 60
+    verify_timeout:     float, optional
+                        Time (in seconds) to wait for the relay's prompt while
+                        verifying the connection. Defaults to `timeout`
+    conn_check:         int, optional
+                        Maximum number of prompt requests sent to a serial
+                        port while verifying the connection, and of attempts
+                        to obtain a clean prompt. Defaults to 5
+    cmd_delay:          float, optional
+                        Time (in seconds) of a single command delay, also the
+                        time to wait before repeating a prompt request to a
+                        serial port. Defaults to 0.025 (seconds)
     logger:             logging.logger
                         Logging object to record communications messages.
     verbose:            bool, optional
                         Control to dictate whether verbose printing operations
                         should be used (often for debugging and learning
                         purposes). Defaults to False
+    cache:              bool, optional
+                        Control to store the auto-configuration results on
+                        disk, so that reconnecting to the same relay only
+                        requires its ID block to be read; results are reused
+                        only while the relay's FID, BFID, CID, PARTNO, and
+                        CONFIG are unchanged. Defaults to False
+    cache_ttl:          float, optional
+                        Maximum age (in seconds) of cached auto-configuration
+                        results which may be reused. Defaults to one day
+    cache_dir:          str, optional
+                        Directory in which cached auto-configuration results
+                        are stored. Defaults to `selprotopy` in the user's
+                        cache directory (honoring `XDG_CACHE_HOME`)
+    invalidate_cache:   bool, optional
+                        Control to discard any cached auto-configuration
+                        results for the relay, along with those remembered
+                        from relays configured earlier in this process.
+                        Defaults to False
+    prompt_retries:     int, optional
+                        Number of consecutive empty reads (each limited by
+                        `timeout`) tolerated while waiting for a command's
+                        response before giving up. Defaults to 3
+    nodelay:            bool, optional
+                        Control to disable Nagle's algorithm on socket and
+                        telnet connections, so each short command is sent
+                        without waiting to coalesce. Defaults to True
 
     Attributes
     ----------
@@ -96,226 +161,313 @@ class SELClient():
                 relay)
     """
 
+    # Fixed Attribute Layout (subclasses should declare their own `__slots__`)
+    __slots__ = (
+        'conn', '_write', '_read_until', '_read_eager', '_wait_readable',
+        '_rxbuf', '_selector', '_cache_key', '_cache_dir', '_cache_ttl',
+    )
+
     def __init__(self, connApi, logger: logging.Logger = None,
                  verbose: bool = False, debug: bool = False, **kwargs):
         """Prepare SELClient."""
+        # Read `telnetlib` Connections Through their Socket Directly, Decoding
+        # in Bulk and Keeping Null Characters Intact (checked by module name so
+        # Serial and Socket users never import the deprecated `telnetlib`)
+        if any(cls.__module__ == 'telnetlib' for cls in type(connApi).__mro__):
+            connApi = socket.TelnetSocket.from_socket(
+                connApi.get_socket(), owner=connApi,
+                nodelay=kwargs.get('nodelay', True)
+            )
+
         # Initialize Inputs
         self.conn = connApi
-        self.verbose = verbose
-        self.logger = logger
-        self.debug = debug
-
-        # Initialize Class Options
-        self.timeout = 60
-        self.__num_con_check__ = 5
-        self.__inter_cmd_delay__ = 0.025
-
-        # Initialize Additional Options that May be Made Available
-        kwarg_keys = kwargs.keys()
-        if 'timeout' in kwarg_keys:
-            self.timeout = kwargs['timeout']
-        if 'conn_check' in kwarg_keys:
-            self.__num_con_check__ = kwargs['conn_check']
-        if 'cmd_delay' in kwarg_keys:
-            self.__inter_cmd_delay__ = kwargs['cmd_delay']
-
-        # Define Basic Parameter Defaults
-        self.fid     = ''
-        self.bfid    = ''
-        self.cid     = ''
-        self.devid   = ''
-        self.partno  = ''
-        self.config  = ''
-
-        # Define Parameters to Indicate Whether Specific Commands are Supported
-        self.fast_meter_supported = False
-        self.fast_meter_demand_supported = False
-        self.fast_meter_peak_demand_supported = False
-        self.fast_operate_supported = False
-
-        # Define the Various Command Defaults
-        self.fm_config_command_1 = commands.FM_CONFIG_BLOCK
-        self.fm_command_1 = commands.FM_DEMAND_CONFIG_BLOCK
-        self.fm_config_command_2 = commands.FM_PEAK_CONFIG_BLOCK
-        self.fm_command_2 = commands.FAST_METER_REGULAR
-        self.fm_config_command_3 = commands.FAST_METER_DEMAND
-        self.fm_command_3 = commands.FAST_METER_PEAK_DEMAND
-        self.fop_command_info = commands.FO_CONFIG_BLOCK
-        self.fmsg_command_info = commands.FAST_MSG_CONFIG_BLOCK
-
-        # Allocate Space for Relay Definition Responses
-        self.fast_meter_definition = None
-        self.fast_demand_definition = None
-        self.fast_peak_demand_definition = None
+        # Raw Sockets and Serial Ports are Read in Large Chunks into a Buffer
+        # (sockets waiting with a Selector so Reads Never Spin); Bytes Beyond a
+        # Prompt Stay Buffered
+        self._rxbuf = bytearray()
+        self._selector = None
+        if hasattr(connApi, 'recv'):
+            socket.tune_socket(connApi, kwargs.get('nodelay', True))
+            self._selector = selectors.DefaultSelector()
+            self._selector.register(connApi, selectors.EVENT_READ)
+        # Resolve the I/O Mechanisms Only Once, Binding them Directly so Each
+        # Call Skips the Connection Type Checks; First Writing: (data) -> None
+        if hasattr(connApi, "read_until"):
+            self._write = connApi.write
+        elif hasattr(connApi, 'sendall'):
+            self._write = connApi.sendall
+        else:
+            # pySerial
+            self._write = connApi.write
+        # Likewise Resolve the Reading Mechanism: (match, timeout) -> bytes
+        if hasattr(connApi, "read_very_eager"):
+            self._read_until = connApi.read_until
+        elif self._selector is not None:
+            self._read_until = self._recv_until
+        else:
+            # pySerial Reads a Byte at a Time in `read_until`, so Read in Bulk
+            self._read_until = self._serial_read_until
+        # And the Eager Reading Mechanism: () -> bytes Already Received
+        if hasattr(connApi, "read_very_eager"):
+            self._read_eager = connApi.read_very_eager
+        elif self._selector is not None:
+            self._read_eager = functools.partial(self._recv_until, None, 0)
+        else:
+            # pySerial
+            self._read_eager = functools.partial(
+                self._serial_read_until, None, None
+            )
+        # And the Readiness Wait: (timeout) -> bool
+        if self._selector is not None:
+            self._wait_readable = self._wait_selector
+        else:
+            try:
+                connApi.fileno()
+                self._wait_readable = self._wait_select
+            except (AttributeError, OSError, ValueError):
+                self._wait_readable = self._wait_in_waiting
+        # Initialize Class Options, with any Made Available, and Reset the
+        # Relay's Description
+        self._init_shared_state(
+            logger=logger, verbose=verbose, debug=debug,
+            timeout=kwargs.get('timeout', 60),
+            conn_check=kwargs.get('conn_check', 5),
+            cmd_delay=kwargs.get('cmd_delay', 0.025),
+            prompt_retries=kwargs.get('prompt_retries', 3),
+            verify_timeout=kwargs.get('verify_timeout', None),
+        )
+
+        # Prepare the Auto-Configuration Cache, when Requested
+        self._cache_key = None
+        self._cache_dir = kwargs.get('cache_dir', None)
+        self._cache_ttl = kwargs.get('cache_ttl', cache.DEFAULT_TTL)
+        if kwargs.get('cache') or kwargs.get('invalidate_cache'):
+            self._cache_key = _endpoint_key(connApi)
+            if kwargs.get('invalidate_cache'):
+                cache.remove_entry(self._cache_key, self._cache_dir)
+                _CONFIGURATION_MEMO.clear()
+            if not kwargs.get('cache'):
+                self._cache_key = None
 
         if hasattr(self.conn, 'settimeout'):
             self.conn.settimeout(self.timeout)
 
         # Verify Connection by Searching for Prompt
-        if 'noverify' not in kwarg_keys:
+        if not kwargs.get('noverify', False):
             if verbose:
-                print('Verifying Connection...')
+                debug_print('Verifying Connection...')
             if not self._verify_connection():
-                raise exceptions.ConnVerificationFail("Verification Failed.")
+                raise exceptions.ConnVerificationFail(
+                    "Verification Failed: relay did not respond with a prompt "
+                    f"within {self._verify_timeout:.3f}s."
+                )
             if verbose:
-                print('Connection Verified.')
+                debug_print('Connection Verified.')
         self.quit()
-        if 'autoconfig' in kwargs:
-            # Run Auto-Configuration
-            if not isinstance(kwargs['autoconfig'], bool):
-                self.autoconfig(verbose=verbose)
-            elif bool(kwargs['autoconfig']):
-                self.autoconfig(verbose=verbose)
+        # Run Auto-Configuration (for any Value Given, Other than False)
+        if kwargs.get('autoconfig', False) is not False:
+            self.autoconfig(verbose=verbose)
+
+    # Define Method to Perform the I/O Requested by Shared Steps (see
+    # `SELClientMixin`), Returning the Result of the Exchange
+    def _run(self, steps):
+        result = None
+        while True:
+            try:
+                operation, *args = steps.send(result)
+            except StopIteration as done:
+                return done.value
+            result = getattr(self, operation)(*args)
+
+    # Define Method to Send a Request
+    def _send(self, data: bytes):
+        self._write( data )
 
     # Define Connectivity Check Method
     def _verify_connection(self):
-        # Set Default Indication
-        connected = False
-        # Iteratively attempt to see relay's response
-        for _ in range(self.__num_con_check__):
-            self._write( commands.CR + commands.CR + commands.CR )
-            if hasattr(self.conn, "read_until"):
-                response = self.conn.read_until( commands.CR )
-            elif hasattr(self.conn, 'socket_read'):
-                response = socket.socket_read(self.conn)
+        budget = self._verify_timeout
+        if hasattr(self.conn, "read_very_eager") or self._selector is not None:
+            # Telnet and Sockets Wait on Readiness, so Write Once and Wait for
+            # the Prompt with the Full Budget, Returning as Soon as it Arrives
+            self._write( commands.CR3 )
+            response = self._read_to_prompt(commands.LEVEL_0, timeout=budget)
+            return commands.LEVEL_0 in response
+        # pySerial Method, Wait for Data Rather than Sleeping, Repeating the
+        # Request (up to `conn_check` Times) Only when a Full Command Delay
+        # Passes Without any Response
+        request = commands.CR3
+        requests_left = self.__num_con_check__ - 1
+        response = bytearray()
+        deadline = time.monotonic() + budget
+        port_timeout = self.conn.timeout
+        self.conn.timeout = 0
+        try:
+            self._write( request )
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                window = min(self.__inter_cmd_delay__, remaining)
+                if not self._wait_readable(window):
+                    if requests_left > 0 and time.monotonic() < deadline:
+                        requests_left -= 1
+                        self._write( request )
+                    continue
+                data = self.conn.read(self.conn.in_waiting or 1)
+                self._debug_print(data)
+                # Search Only the New Data (and a Prompt Split Across Reads)
+                scan_from = max(0, len(response) - len(commands.LEVEL_0) + 1)
+                response += data
+                if response.find(commands.LEVEL_0, scan_from) != -1:
+                    # Relay Responded
+                    return True
+        finally:
+            self.conn.timeout = port_timeout
+
+    # Define Methods to Wait (up to `timeout`) for Received Data, One of which
+    # is Bound as `_wait_readable` According to the Connection Type
+    def _wait_selector(self, timeout):
+        return bool(self._rxbuf) or bool(self._selector.select(timeout))
+
+    def _wait_select(self, timeout):
+        # Sockets and POSIX Serial Ports Provide a File Descriptor
+        readable, _, _ = select.select([self.conn], [], [], timeout)
+        return bool(readable)
+
+    def _wait_in_waiting(self, timeout):
+        # Other Serial Ports (e.g. Windows) Only Report their Input Queue
+        deadline = time.monotonic() + timeout
+        while not self.conn.in_waiting:
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.001)
+        return True
+
+    # Define Lightweight Check that a (Reused) Connection is Still Responsive
+    def _alive(self):
+        budget = self._verify_timeout
+        try:
+            # Discard Stale Data so Only a Fresh Prompt Counts
+            self._read_eager()
+            self._write( commands.CR )
+            response = self._read_to_prompt(commands.LEVEL_0, timeout=budget)
+            # Discard the Remainder of the Prompt
+            self._read_eager()
+        except (OSError, EOFError):
+            return False
+        return commands.LEVEL_0 in response
+
+    # Define Method to Read a Raw Socket Through a Byte-String (or Timeout)
+    def _recv_until(self, match, timeout):
+        buffer = self._rxbuf
+        deadline = time.monotonic() + timeout
+        index = -1 if match is None else buffer.find(match)
+        while index == -1:
+            remaining = deadline - time.monotonic()
+            if not self._selector.select(max(remaining, 0)):
+                break
+            data = self.conn.recv(socket.RECV_CHUNK_SIZE)
+            if not data:
+                break
+            if match is not None:
+                scan_from = max(0, len(buffer) - len(match) + 1)
+                buffer += data
+                index = buffer.find(match, scan_from)
             else:
-                # pySerial Method
-                response = self.conn.read_until( commands.CR )
-            if self.debug:
-                print(response)
-            if commands.LEVEL_0 in response:
-                # Relay Responded
-                connected = True
+                buffer += data
+        return self._take_buffered(index, match)
+
+    # Define Method to Read a Serial Port Through a Byte-String (or Timeout)
+    def _serial_read_until(self, match, timeout):
+        # Wait for Data (up to `timeout`, or the port's timeout when shorter),
+        # then Take Everything Already Waiting in a Single Read
+        conn = self.conn
+        buffer = self._rxbuf
+        if match is None:
+            buffer += conn.read(conn.in_waiting)
+            return self._take_buffered(-1, match)
+        index = buffer.find(match)
+        if conn.timeout is not None:
+            timeout = min(timeout, conn.timeout)
+        deadline = time.monotonic() + timeout
+        while index == -1:
+            waiting = conn.in_waiting
+            if not waiting:
+                remaining = max(deadline - time.monotonic(), 0)
+                if not self._wait_readable(remaining):
+                    break
+                waiting = conn.in_waiting
+            data = conn.read(max(1, waiting))
+            if not data:
                 break
-            time.sleep( self.__inter_cmd_delay__ )
-        # Return Status
-        return connected
-
-    # Define Method to Handle Eager Reading Between Connection Methods
-    def _read_eager(self):
-        # Switch on Connection Type
-        if hasattr(self.conn, "read_until"):
-            return self.conn.read_very_eager()
-        elif hasattr(self.conn, 'socket_read'):
-            return socket.socket_read(self.conn)
-        # pySerial
-        return self.conn.read_very_eager()
+            scan_from = max(0, len(buffer) - len(match) + 1)
+            buffer += data
+            index = buffer.find(match, scan_from)
+        return self._take_buffered(index, match)
+
+    # Define Method to Take a Response (through `match`, if Found) from the
+    # Receive Buffer, Leaving any Later Bytes for the Next Read
+    def _take_buffered(self, index, match):
+        buffer = self._rxbuf
+        end = len(buffer) if index == -1 else index + len(match)
+        # Copy Once, Directly from the Buffer (released before it is resized)
+        with memoryview(buffer) as view:
+            response = bytes(view[:end])
+        del buffer[:end]
+        return response
 
     # Define Method to "Clear" the Buffer
     def _clear_input_buffer(self):
         try:
             resp = self._read_eager()
-            if self.logger:
-                self.logger.info(f'Rx: {resp}')
-            if self.debug:
-                print('Clearing buffer:', resp)
-            while b'' != resp:
-                time.sleep(self.__inter_cmd_delay__ * 10)
+            if self.logger and self.logger.isEnabledFor(logging.INFO):
+                self.logger.info('Rx: %s', resp)
+            self._debug_print('Clearing buffer:', resp)
+            # Keep Draining while Data Continues to Arrive, Stopping as Soon as
+            # the Connection is Quiet for a Command Delay
+            while resp and self._wait_readable(self.__inter_cmd_delay__):
                 resp = self._read_eager()
-                if self.logger:
-                    self.logger.info(f'Rx: {resp}')
-                if self.debug:
-                    print('Clearing buffer:', resp)
+                if self.logger and self.logger.isEnabledFor(logging.INFO):
+                    self.logger.info('Rx: %s', resp)
+                self._debug_print('Clearing buffer:', resp)
         except Exception:
             # pySerial Method
             self.conn.reset_input_buffer()
 
-    # Define Method to Handle Writing for telnetlib-vs-socket
-    def _write(self, data):
-        # Switch on Writing Mechanism
-        if hasattr(self.conn, "read_until"):
-            self.conn.write(data)
-        elif hasattr(self.conn, 'sendall'):
-            self.conn.sendall(data)
-        else:
-            # pySerial
-            self.conn.write(data)
-
     # Define Method to Read All Data to Next Relay Prompt
-    def _read_to_prompt(self, prompt_str=commands.PROMPT):
-        if hasattr(self.conn, "read_until"):
-            try:
-                # Telnetlib Supports a Timeout
-                response = self.conn.read_until(
-                    prompt_str,
-                    timeout=self.timeout
-                )
-            # PySerial Does not Support Timeout
-            except TypeError:
-                response = self.conn.read_until(prompt_str)
-        elif hasattr(self.conn, 'socket_read'):
-            response = socket.socket_read(self.conn)
-        if self.logger:
-            self.logger.debug(f'Rx: {response}')
-        if self.debug:
-            print(response)
+    def _read_to_prompt(self, prompt_str=commands.PROMPT, timeout=None):
+        if timeout is None:
+            timeout = self.timeout
+        response = self._read_until(prompt_str, timeout)
+        if self.logger and self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug('Rx: %s', response)
+        self._debug_print(response)
         return response
 
     # Define Method to Read All Data After a Command (and to next relay prompt)
     def _read_command_response(self, command, prompt_str=commands.PROMPT):
-        if isinstance(command, bytes):
-            command = command.replace(b'\n', b'')
-            command = command.replace(b'\r', b'')
-        elif isinstance(command, str):
-            command = command.replace('\n', '')
-            command = command.replace('\r', '')
-        response = b''
-        i = 0
-        while (response.find(command) == -1) and (i < 10):
-            sz = len(response)  # Capture Previous Size
-            response += self._read_to_prompt( prompt_str=prompt_str )
-            i = 0 if len(response) != sz else i + 1
-            # Check for Invalid Command Response from Relay
-            if INVALID_COMMAND_STR in response:
-                raise exceptions.InvalidCommand(
-                    f"Relay Reports Invalid Command: '{response}'"
-                )
-        return response
+        return self._run(self._command_response_steps(command, prompt_str))
 
     # Define Method to Read Until a "Clean" Prompt is Viewed
     def _read_clean_prompt(self):
-        """
-        Read and Send Carriage Return Characters to Clean Prompt.
-
-        Strategy
-        --------
-
-        Continue to send <CR><LF> until the counted "clean" responses reaches 3
-        or more.
-        """
-        count = 0
-        response = b''
-        while count < 3:
-            self._write( commands.CR )      # Write
-            response += self._read_to_prompt()   # Read
-            if self.debug:
-                print('Clean prompt response:', response)
-            # Count the Number of Clean Prompt Responses
-            if parser.clean_prompt(response):
-                count += 1
-            else:
-                count = 0
-            time.sleep(self.__inter_cmd_delay__)
-        self._clear_input_buffer()  # Empty anything left in the buffer
-        time.sleep(self.__inter_cmd_delay__)
-
-    # Define Method to Attempt Reading Everything (only for telnetlib)
-    def _read_everything(self):
-        response = self._read_eager()
-        if self.logger:
-            self.logger.info(f'Rx: {response}')
-        if self.debug:
-            print(response)
-        return response
+        self._run(self._clean_prompt_steps())
 
     # Define Method to Identify Current Access Level
-    def access_level(self):
+    def access_level(self, refresh: bool = False):
         """
         Identify Current Access Level.
 
         Simple method to identify what the current access level
         is for the connected relay. Provides an integer and
-        string.
+        string. A level observed or entered by this client within the
+        last `ACCESS_LEVEL_TTL` seconds is returned without asking
+        the relay again.
+
+        Parameters
+        ----------
+        refresh:    bool, optional
+                    Control to always ask the relay for its access level,
+                    defaults to False.
 
         Returns
         -------
@@ -324,20 +476,7 @@ class SELClient():
         desc:   String describing the access level,
                 will return empty string for level-0.
         """
-        # Retrieve Prompt Twice
-        self._write( commands.CR )
-        resp = self._read_to_prompt()
-        self._write( commands.CR )
-        resp += self._read_to_prompt()
-        # Look for Each Level, Return Highest Found
-        if commands.LEVEL_C in resp:
-            return (3, 'CAL')
-        elif commands.LEVEL_2 in resp:
-            return (2, '2AC')
-        elif commands.LEVEL_1 in resp:
-            return (1, 'ACC')
-        else:
-            return (0, '')
+        return self._run(self._access_level_steps(refresh))
 
     # Define Method to Return to Access Level 0
     def quit(self):
@@ -352,9 +491,7 @@ class SELClient():
         access_level_1      : Elevate permission to ACC
         access_level_2      : Elevate permission to 2AC
         """
-        self._write( commands.QUIT )
-        self._read_to_prompt( commands.LEVEL_0 )
-        self._read_clean_prompt()
+        self._run(self._quit_steps())
 
     # Define Method to Access Level 1
     def access_level_1(self, level_1_pass: str = commands.PASS_ACC, **kwargs):
@@ -383,26 +520,7 @@ class SELClient():
         success:            bool
                             Indicator of whether the login failed.
         """
-        # Identify Current Access Level
-        time.sleep(self.__inter_cmd_delay__)
-        level, _ = self.access_level()
-        if self.debug:
-            print("Logging in to ACC")
-        self._write( commands.GO_ACC )
-        # Provide Password
-        if level == 0:
-            time.sleep( int(self.__inter_cmd_delay__ * 3) )
-            self._write( level_1_pass + commands.CR )
-            time.sleep( self.__inter_cmd_delay__ )
-        resp = self._read_to_prompt( commands.LEVEL_0 )
-        if b'Invalid' in resp:
-            if self.debug:
-                print("Log-In Failed")
-            return False
-        else:
-            if self.debug:
-                print("Log-In Succeeded")
-            return True
+        return self._run(self._access_level_1_steps(level_1_pass))
 
     # Define Method to Access Level 2
     def access_level_2(self, level_2_pass: str = commands.PASS_2AC, **kwargs):
@@ -431,31 +549,11 @@ class SELClient():
         success:            bool
                             Indicator of whether the login failed.
         """
-        # Identify Current Access Level
-        level, _ = self.access_level()
-        # Provide Password
-        if level == 0:
-            if not self.access_level_1( **kwargs ):
-                return False
-        if self.debug:
-            print("Logging in to 2AC")
-        self._write( commands.GO_2AC )
-        if level in [0, 1]:
-            time.sleep( int(self.__inter_cmd_delay__ * 3) )
-            self._write( level_2_pass + commands.CR )
-            time.sleep( self.__inter_cmd_delay__ )
-        resp = self._read_to_prompt( commands.LEVEL_0 )
-        if b'Invalid' in resp:
-            if self.debug:
-                print("Log-In Failed")
-            return False
-        else:
-            if self.debug:
-                print("Log-In Succeeded")
-            return True
+        return self._run(self._access_level_2_steps(level_2_pass, **kwargs))
 
     # Define Method to Perform Auto-Configuration Process
-    def autoconfig( self, attempts: int = 0, verbose: bool = False, **kwargs ):
+    def autoconfig( self, attempts: int = 0, verbose: bool = False,
+                    force_refresh: bool = False, **kwargs ):
         """
         Auto-Configure SELClient Instance.
 
@@ -479,6 +577,10 @@ class SELClient():
         - Fast Meter Peak Demand Configuration Block
         - Fast Operate Configuration Block
 
+        When a relay with the same identification and relay definition block
+        was already configured in this process, its configuration and DNA
+        blocks are reused rather than requested again.
+
         See Also
         --------
         autoconfig_fastmeter            : Auto Configuration for Fast Meter
@@ -500,52 +602,93 @@ class SELClient():
                         Control to dictate whether verbose printing operations
                         should be used (often for debugging and learning
                         purposes). Defaults to False
+        force_refresh:  bool, optional
+                        Control to ignore cached auto-configuration results
+                        (when caching is enabled) and those of identical
+                        relays configured earlier in this process, reading
+                        every block from the relay. Defaults to False
         """
         self.quit()
-        # Determine Command Strings and Relay Information
-        self.autoconfig_relay_definition(attempts=attempts, verbose=self.debug)
-        if self.fast_meter_supported:
-            self.autoconfig_fastmeter( verbose=self.debug )
-        if self.fast_meter_demand_supported:
-            self.autoconfig_fastmeter_demand( verbose=self.debug )
-        if self.fast_meter_peak_demand_supported:
-            self.autoconfig_fastmeter_peakdemand( verbose=self.debug )
-        if self.fast_operate_supported:
-            self.autoconfig_fastoperate( verbose=self.debug )
-        # Determine if Level 0, and Escalate Accordingly
-        if self.access_level()[0] == 0:
-            # Access Level 1 Required to Request DNA
-            self.access_level_1( **kwargs )
-        # Request Relay ENA Block
-        # TODO
-        # Request Relay DNA Block
-        self._read_clean_prompt()
-        if verbose:
-            print("Reading Relay DNA Block...")
-        self._write( commands.DNA )
-        self.dnaDef = parser.relay_dna_block(
-            self._read_command_response(commands.DNA),
-            encoding='utf-8',
-            verbose=self.debug
+        # Reuse Cached Results if the Relay is Unchanged
+        if self._cache_key is not None and not force_refresh:
+            if self._autoconfig_from_cache(verbose=verbose):
+                return
+        self._config_responses = {}
+        # Request Relay Definition and ID Blocks Together
+        if not self._run(self._definition_and_id_steps(verbose=verbose)):
+            # Request a Malformed Definition Block Again, on its Own
+            self.autoconfig_relay_definition(
+                attempts=attempts,
+                verbose=self.debug
+            )
+        # Reuse the Remaining Blocks of an Identical Relay Configured Earlier
+        identity = tuple(_cache_identity(self))
+        if not force_refresh and self._autoconfig_from_memo(identity, verbose):
+            return
+        # Request the Configuration Blocks, then the DNA Block
+        for name in self._run(self._configuration_steps(verbose, **kwargs)):
+            # Request a Malformed Block Again, on its Own
+            getattr(self, CONFIGURATION_BLOCKS[name][3])( verbose=self.debug )
+        _CONFIGURATION_MEMO[identity] = dict(self._config_responses)
+        # Store the Results for Later Connections
+        if self._cache_key is not None:
+            cache.store_entry(self._cache_key, {
+                'identity': _cache_identity(self),
+                'responses': self._config_responses,
+            }, self._cache_dir)
+
+    # Define Method to Restore Auto-Configuration Results from the Cache
+    def _autoconfig_from_cache(self, verbose: bool = False):
+        entry = cache.load_entry(
+            self._cache_key, self._cache_ttl, self._cache_dir
         )
-        # Request Relay BNA Block
-        # TODO
-        # Request Relay ID Block
+        if entry is None:
+            return False
+        # Only the ID Block is Read to Confirm the Relay is Unchanged
+        self._run(self._id_block_steps(verbose=verbose))
+        if _cache_identity(self) != entry.get('identity'):
+            return False
         if verbose:
-            print("Reading Relay ID Block...")
-        self._write( commands.ID )
-        id_block = parser.relay_id_block(
-            self._read_command_response(commands.ID),
-            encoding='utf-8',
-            verbose=self.debug
-        )
-        # Store Relay Information
-        self.fid    = id_block['FID']
-        self.bfid   = id_block['BFID']
-        self.cid    = id_block['CID']
-        self.devid  = id_block['DEVID']
-        self.partno = id_block['PARTNO']
-        self.config = id_block['CONFIG']
+            debug_print("Restoring Cached Configuration Blocks...")
+        responses = entry['responses']
+        try:
+            self._load_relay_definition(
+                parse_relay_definition(responses['definition'])
+            )
+            self._load_configuration_blocks(responses)
+        except (exceptions.CommError, KeyError, ValueError, IndexError):
+            # Damaged Entry, Discard it and Configure from the Relay
+            cache.remove_entry(self._cache_key, self._cache_dir)
+            return False
+        self._config_responses = responses
+        return True
+
+    # Define Method to Restore the Blocks Read Earlier from an Identical Relay
+    def _autoconfig_from_memo(self, identity: tuple, verbose: bool = False):
+        responses = _CONFIGURATION_MEMO.get(identity)
+        # The Definition Block was Just Read; it Must Match as Well
+        if (responses is None or
+                responses['definition'] != self._config_responses.get(
+                    'definition')):
+            return False
+        if verbose:
+            debug_print("Restoring Configuration Blocks of an Identical Relay...")
+        self._load_configuration_blocks(responses)
+        self._config_responses = dict(responses)
+        if self._cache_key is not None:
+            cache.store_entry(self._cache_key, {
+                'identity': list(identity),
+                'responses': self._config_responses,
+            }, self._cache_dir)
+        return True
+
+    # Define Method to Load the Configuration and DNA Blocks from Responses
+    def _load_configuration_blocks(self, responses: dict):
+        for name, (attribute, _, parse_cached, _) in (
+                CONFIGURATION_BLOCKS.items()):
+            if name in responses:
+                setattr(self, attribute, parse_cached(responses[name]))
+        self.dnaDef = parse_relay_dna(responses['dna'])
 
     # Define Method to Pack the Config Messages
     @retry(fail_msg="Relay Definition Parsing Failed.")
@@ -578,50 +721,10 @@ class SELClient():
         """
         # Request Relay Definition
         if verbose:
-            print("Reading Relay Definition Block...")
+            debug_print("Reading Relay Definition Block...")
         verbose = verbose or self.debug
-        self._write(commands.RELAY_DEFINITION + commands.CR )
-        definition = parser.relay_definition_block(
-            self._read_command_response(commands.RELAY_DEFINITION),
-            verbose=verbose
-        )
-        # Load the Relay Definition Information and Request the Meter Blocks
-        if definition['fmmessagesup'] >= 1:
-            if verbose:
-                print("Reading Fast Meter Definition Block...")
-            self.fm_config_command_1   = \
-                definition['fmcommandinfo'][0]['configcommand']
-            self.fm_command_1         = \
-                definition['fmcommandinfo'][0]['command']
-            self.fast_meter_supported = True
-        if definition['fmmessagesup'] >= 2:
-            if verbose:
-                print("Reading Fast Meter Demand Definition Block...")
-            self.fm_config_command_2   = \
-                definition['fmcommandinfo'][1]['configcommand']
-            self.fm_command_2         = \
-                definition['fmcommandinfo'][1]['command']
-            self.fast_meter_demand_supported = True
-        if definition['fmmessagesup'] >= 3:
-            if verbose:
-                print("Reading Fast Meter Peak Demand Definition Block...")
-            self.fm_config_command_3   = \
-                definition['fmcommandinfo'][2]['configcommand']
-            self.fm_command_3         = \
-                definition['fmcommandinfo'][2]['command']
-            self.fast_meter_peak_demand_supported = True
-        # Interpret the Fast Operate Information if Present
-        if definition['fopcommandinfo'] != '':
-            if verbose:
-                print("Reading Fast Operate Definition Block...")
-            self.fop_command_info     = definition['fopcommandinfo']
-            self.fast_operate_supported = True
-        # Interpret the Fast Message Information if Present
-        if definition['fmsgcommandinfo'] != '':
-            if verbose:
-                print("Reading Fast Message Definition Block...")
-            self.fmsg_command_info    = definition['fmsgcommandinfo']
-
+        self._write( commands.RELAY_DEFINITION_REQUEST )
+        self._run(self._relay_definition_steps(verbose=verbose))
 
     # Define Method to Run the Fast Meter Configuration
     @retry(fail_msg="Fast Meter Autoconfig Failed.")
@@ -652,11 +755,8 @@ class SELClient():
                         Defaults to False
         """
         # Fast Meter
-        self._read_clean_prompt()
-        self._write( self.fm_config_command_1 + commands.CR )
-        self.fast_meter_definition = parser.fast_meter_configuration_block(
-            self._read_to_prompt(),
-            verbose=verbose,
+        self._autoconfig_block(
+            'fast_meter', self._fm_config_requests[0], verbose=verbose
         )
 
     # Define Method to Run the Fast Meter Demand Configuration
@@ -689,11 +789,8 @@ class SELClient():
                         Defaults to False
         """
         # Fast Meter Demand
-        self._read_clean_prompt()
-        self._write( self.fm_config_command_2 + commands.CR )
-        self.fast_demand_definition = parser.fast_meter_configuration_block(
-            self._read_to_prompt(),
-            verbose=verbose,
+        self._autoconfig_block(
+            'fast_demand', self._fm_config_requests[1], verbose=verbose
         )
 
     # Define Method to Run the Fast Meter Peak Demand Configuration
@@ -726,11 +823,8 @@ class SELClient():
                         Defaults to False
         """
         # Fast Meter Peak Demand
-        self._read_clean_prompt()
-        self._write( self.fm_config_command_3 + commands.CR )
-        self.fast_peak_demand_definition = parser.fast_meter_configuration_block(
-            self._read_to_prompt(),
-            verbose=verbose,
+        self._autoconfig_block(
+            'fast_peak_demand', self._fm_config_requests[2], verbose=verbose
         )
 
     # Define Method to Run the Fast Operate Configuration
@@ -761,14 +855,16 @@ class SELClient():
                         should be used (often for debugging purposes).
                         Defaults to False
         """
-        # Fast Meter Peak Demand
-        self._read_clean_prompt()
-        self._write( self.fop_command_info + commands.CR )
-        self.fastOpDef = parser.fast_op_configuration_block(
-            self._read_to_prompt(),
-            verbose=verbose,
+        # Fast Operate
+        self._autoconfig_block(
+            'fast_operate', self._fop_config_request, verbose=verbose
         )
 
+    # Define Method to Request, Store, and Parse a Single Configuration Block
+    def _autoconfig_block(self, name: str, request: bytes,
+                          verbose: bool = False):
+        self._run(self._configuration_block_steps(name, request, verbose))
+
     # Define Method to Perform Fast Meter Polling
     def poll_fast_meter(self, minAccLevel: bool = 0, verbose: bool = False,
                         **kwargs):
@@ -803,10 +899,11 @@ class SELClient():
             self.access_level_2( **kwargs )
         # Poll Client for Data
         self._read_clean_prompt()
-        self._write( self.fm_command_1 + commands.CR )
+        fm_command = self._fm[0][1]
+        self._write( self._fm_requests[0] )
         response = parser.fast_meter_block(
             self._read_command_response(
-                self.fm_command_1
+                fm_command
             ),
             self.fast_meter_definition,
             self.dnaDef,
@@ -843,12 +940,11 @@ class SELClient():
                         Defaults to 'trip'
         """
         # Write the Command
-        command_str = commands.prepare_fastop_command(
-            control_type='breaker_bit', control_point=control_point,
-            command=command, fastop_def=self.fastOpDef
+        command_str = self._prepare_fastop_command(
+            'breaker_bit', control_point, command
         )
         if self.verbose:
-            print(command_str)
+            debug_print(command_str)
         self._write( command_str )
 
     # Define Method to Send Fast Operate Command for Remote Bit
@@ -879,12 +975,11 @@ class SELClient():
                         Defaults to 'pulse'
         """
         # Write the Command
-        command_str = commands.prepare_fastop_command(
-            control_type='remote_bit', control_point=control_point,
-            command=command, fastop_def=self.fastOpDef
+        command_str = self._prepare_fastop_command(
+            'remote_bit', control_point, command
         )
         if self.verbose:
-            print(command_str)
+            debug_print(command_str)
         self._write( command_str )
 
 
@@ -906,9 +1001,13 @@ if __name__ == '__main__':
     #             print(name, value)
     #         time.sleep(1)
     #     poller.send_remote_bit_fast_op('RB1', 'pulse')
-    sock = socket.create_connection(('192.168.2.210', 23))
+    sock = socket.socket.create_connection(('192.168.2.210', 23))
     print('Initializing Client...')
-    poller = SELClient( sock, logger=logger_obj, verbose=True, debug=True )
+    try:
+        poller = SELClient( sock, logger=logger_obj, verbose=True, debug=True )
+    except exceptions.ConnVerificationFail as err:
+        sock.close()
+        raise SystemExit(err) from err
     poller.autoconfig_relay_definition(verbose=True)
     poller.autoconfig(verbose=True)
 
@@ -16,13 +16,36 @@ SEL Protocol Application Guide: https://selinc.com/api/download/5026/
 """
 ################################################################################
 
-from typing import Optional
+import time
+import threading
+import collections
+import concurrent.futures
+from typing import Optional, Iterable
 
 from selprotopy.client.base import SELClient
 from selprotopy.support import socket
 
 __all__ = ["TCPSELClient"]
 
+# Most Idle Clients Retained for Reuse by `TCPSELClient.from_endpoint`
+POOL_SIZE = 32
+
+# Most Relays Connected Simultaneously by `TCPSELClient.connect_many`
+CONNECT_WORKERS = 32
+
+# Idle (Released) Clients: (class, host, port, options) -> (client, time
+# released), Least Recent First; Guarded by the Lock. Clients are Removed while
+# in Use, so Each is Only Ever Held by a Single Caller
+_CLIENT_CACHE = collections.OrderedDict()
+_CLIENT_CACHE_LOCK = threading.Lock()
+
+
+def _discard(client):
+    try:
+        client.conn.close()
+    except OSError:
+        pass
+
 class TCPSELClient(SELClient):
     """
     `SELClient` Class for Polling an SEL Relay/Intelligent Electronic Device.
@@ -82,6 +105,8 @@ class TCPSELClient(SELClient):
                 relay)
     """
 
+    __slots__ = ('_pool_key',)
+
     def __init__(
         self,
         ip_address: str,
@@ -89,7 +114,185 @@ class TCPSELClient(SELClient):
         **kwargs
     ):
         """Connect over Serial to the SEL Protocol Device."""
+        # Only Clients from `from_endpoint` Return to the Pool
+        self._pool_key = None
         # Establish a TCP Connection
         connection = socket.socket.create_connection((ip_address, port))
-        # Attach Super Object
-        super().__init__(connApi=connection, **kwargs)
+        # Attach Super Object, Releasing the Socket if the Relay is Unusable
+        try:
+            super().__init__(connApi=connection, **kwargs)
+        except BaseException:
+            connection.close()
+            raise
+
+    @classmethod
+    def from_endpoint(
+        cls,
+        ip_address: str,
+        port: Optional[int] = 23,
+        pool: bool = True,
+        pool_ttl: Optional[float] = None,
+        **kwargs
+    ):
+        """
+        Connect to a Relay, Reusing a Pooled Client when Possible.
+
+        The client is for the caller's exclusive use until it is handed back
+        with `release` (or by leaving a `with` block), after which it is
+        retained (up to `POOL_SIZE` idle clients, least recently released are
+        closed first) so that reconnecting to the same relay returns the live,
+        already-configured client instead of repeating the connection
+        verification and auto-configuration handshake.
+
+        A pooled client is only reused by calls passing the same `**kwargs`
+        (after `autoconfig` is defaulted) it was built with, so it is always
+        configured as the caller asked; calls with other options connect a
+        new client, which is pooled separately. Calls passing unhashable
+        options are never pooled.
+
+        ```
+        with TCPSELClient.from_endpoint('192.168.1.10') as client:
+            client.poll_fast_meter()
+        ```
+
+        Parameters
+        ----------
+        ip_address: str
+                    Relay host name or address.
+        port:       int, optional
+                    TCP port of the relay, defaults to 23.
+        pool:       bool, optional
+                    Control to enable reuse of pooled clients, when False a
+                    new (un-pooled) client is always created. Defaults to True
+        pool_ttl:   float, optional
+                    Maximum time (in seconds) a client may have been idle in
+                    the pool and still be reused, older clients are closed and
+                    replaced. Defaults to None (no limit)
+        **kwargs:   Additional arguments passed to the `TCPSELClient`; the
+                    client is auto-configured unless `autoconfig` is given.
+
+        Returns
+        -------
+        TCPSELClient:   Responsive client connected to the relay.
+        """
+        kwargs.setdefault('autoconfig', True)
+        if not pool:
+            return cls(ip_address, port, **kwargs)
+        # Clients are Only Reused by Calls Asking for the Same Options
+        key = (cls, ip_address, port, frozenset(kwargs.items()))
+        try:
+            hash(key)
+        except TypeError:
+            return cls(ip_address, port, **kwargs)
+        # Take the Idle Client Out of the Pool; Nobody Else can Reach it Now
+        with _CLIENT_CACHE_LOCK:
+            pooled = _CLIENT_CACHE.pop(key, None)
+        if pooled is not None:
+            client, released_at = pooled
+            expired = (
+                pool_ttl is not None
+                and time.monotonic() - released_at > pool_ttl
+            )
+            if not expired and client._alive():
+                client._pool_key = key
+                return client
+            _discard(client)
+        client = cls(ip_address, port, **kwargs)
+        client._pool_key = key
+        return client
+
+    def release(self):
+        """
+        Hand a Client from `from_endpoint` Back to the Pool.
+
+        The client must not be used after it is released. Clients which were
+        not built by `from_endpoint` are closed instead.
+        """
+        key, self._pool_key = self._pool_key, None
+        if key is None:
+            _discard(self)
+            return
+        with _CLIENT_CACHE_LOCK:
+            replaced = _CLIENT_CACHE.pop(key, None)
+            _CLIENT_CACHE[key] = (self, time.monotonic())
+            evicted = [] if replaced is None else [replaced[0]]
+            while len(_CLIENT_CACHE) > POOL_SIZE:
+                evicted.append(_CLIENT_CACHE.popitem(last=False)[1][0])
+        for stale in evicted:
+            _discard(stale)
+
+    def __enter__(self):
+        """Enter Context."""
+        return self
+
+    def __exit__(self, *args):
+        """Release (or Close) the Client when Leaving Context."""
+        self.release()
+
+    @classmethod
+    def connect_many(
+        cls,
+        endpoints: Iterable,
+        max_workers: Optional[int] = None,
+        return_exceptions: bool = False,
+        **kwargs
+    ):
+        """
+        Connect to (and Auto-Configure) Many Relays Concurrently.
+
+        Each relay's handshake is mostly spent waiting on responses, so the
+        relays are connected in parallel by a pool of worker threads, rather
+        than one after another.
+
+        Parameters
+        ----------
+        endpoints:          iterable
+                            Relays to connect to, each given as a host name
+                            (using port 23) or a `(host, port)` pair.
+        max_workers:        int, optional
+                            Maximum number of relays connected at once,
+                            defaults to `CONNECT_WORKERS`.
+        return_exceptions:  bool, optional
+                            Control to return the exception raised for a relay
+                            in place of its client, rather than raising it
+                            once all relays have been attempted. Defaults to
+                            False
+        **kwargs:           Additional arguments passed to `from_endpoint`.
+
+        Returns
+        -------
+        dict:               Clients keyed by the endpoints given, each for the
+                            caller's exclusive use until it is released (see
+                            `from_endpoint`).
+        """
+        endpoints = list(dict.fromkeys(endpoints))
+        if not endpoints:
+            return {}
+        workers = min(max_workers or CONNECT_WORKERS, len(endpoints))
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix='selprotopy-connect'
+        ) as executor:
+            futures = {
+                endpoint: executor.submit(
+                    cls.from_endpoint,
+                    *((endpoint,) if isinstance(endpoint, str) else endpoint),
+                    **kwargs
+                )
+                for endpoint in endpoints
+            }
+        clients = {}
+        failure = None
+        for endpoint, future in futures.items():
+            error = future.exception()
+            if error is None:
+                clients[endpoint] = future.result()
+            elif return_exceptions:
+                clients[endpoint] = error
+            elif failure is None:
+                failure = error
+        if failure is not None:
+            # Return the Clients Already Connected (closing un-pooled ones)
+            for client in clients.values():
+                client.release()
+            raise failure
+        return clients
@@ -81,6 +81,8 @@ class SerialSELClient(SELClient):
                 relay)
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         port=None,
@@ -0,0 +1,619 @@
+################################################################################
+"""
+selprotopy: A Protocol Binding Suite for the SEL Protocol Suite.
+
+Supports:
+    - SEL Fast Meter
+    - SEL Fast Message
+    - SEL Fast Operate
+
+Author(s):
+    - Joe Stanley: engineerjoe440@yahoo.com
+
+Homepage: https://github.com/engineerjoe440/sel-proto-py
+
+SEL Protocol Application Guide: https://selinc.com/api/download/5026/
+"""
+################################################################################
+
+# Standard Imports
+import sys
+import time
+import operator
+import functools
+import concurrent.futures
+
+# Local Imports
+from selprotopy.common import debug_print, discard_print, INVALID_COMMAND_STR
+from selprotopy import exceptions
+from selprotopy.protocol import commands, parser
+
+# Request and Response Handling Shared by the Blocking `SELClient` and the
+# Asynchronous `AsyncSELClient`, which Differ Only in how they Move Bytes
+__all__ = [
+    'FAST_METER_COMMAND_DEFAULTS', 'RELAY_ID_FIELDS', 'ACCESS_LEVEL_TTL',
+    'CONFIGURATION_BLOCKS', 'relay_id_fields', 'strip_line_endings',
+    'parse_access_level', 'parse_pool', 'parse_relay_definition',
+    'parse_fast_meter_configuration', 'parse_fast_op_configuration',
+    'parse_relay_dna', 'parse_relay_id', 'SELClientMixin',
+]
+
+# Default (Configuration Command, Command) Pairs for each Fast Meter Type
+FAST_METER_COMMAND_DEFAULTS = commands.FAST_METER_COMMAND_DEFAULTS
+
+
+# Extract the Relay Identification Fields Stored on the Client, in Order
+RELAY_ID_FIELDS = operator.itemgetter(
+    'FID', 'BFID', 'CID', 'DEVID', 'PARTNO', 'CONFIG'
+)
+
+
+# Relays of a Fleet Largely Share their Identification, so the Strings are
+# Interned for Clients to Share (and to Compare by Identity)
+def relay_id_fields(id_block: dict):
+    """Return the interned (FID, BFID, CID, DEVID, PARTNO, CONFIG) fields."""
+    return tuple(map(sys.intern, RELAY_ID_FIELDS(id_block)))
+
+
+# Commands are Found in Responses Without their Line Endings; Callers Repeat the
+# Same Few Commands, so the Stripped Forms are Memoized
+_LINE_ENDINGS = str.maketrans('', '', '\r\n')
+
+@functools.lru_cache(maxsize=64)
+def strip_line_endings(command):
+    """Return the command (str or bytes) without carriage returns/newlines."""
+    if isinstance(command, str):
+        return command.translate(_LINE_ENDINGS)
+    return command.translate(None, b'\r\n')
+
+
+# Identify the Highest Access Level Indicated in a Response, in a Single Scan
+def parse_access_level(response: bytes):
+    """Return the highest (level, name) indicated by the response's prompts."""
+    return max(
+        map(commands.ACCESS_LEVELS.get,
+            commands.RE_ACCESS_LEVEL.findall(response)),
+        default=(0, '')
+    )
+
+
+# Relays Return to Access Level 0 after (at Least) a Minute Without Activity, so
+# a Level Observed or Entered is Trusted (rather than Probed) for that Long
+ACCESS_LEVEL_TTL = 60
+
+
+# Shared Worker for Parsing Responses while the Next Request is in Flight
+@functools.lru_cache(maxsize=None)
+def parse_pool():
+    """Return the thread pool shared by all clients for parsing responses."""
+    return concurrent.futures.ThreadPoolExecutor(
+        max_workers=2, thread_name_prefix='selprotopy-parse'
+    )
+
+
+# Relays Sharing Firmware Return Identical Configuration Blocks, so the Parsed
+# Results are Memoized by Raw Response (callers must treat them as read-only)
+@functools.lru_cache(maxsize=64)
+def parse_relay_definition(data: bytes):
+    """Memoized `parser.relay_definition_block`."""
+    return parser.relay_definition_block(data)
+
+@functools.lru_cache(maxsize=64)
+def parse_fast_meter_configuration(data: bytes):
+    """Memoized `parser.fast_meter_configuration_block`."""
+    return parser.fast_meter_configuration_block(data)
+
+@functools.lru_cache(maxsize=64)
+def parse_fast_op_configuration(data: bytes):
+    """Memoized `parser.fast_op_configuration_block`."""
+    return parser.fast_op_configuration_block(data)
+
+@functools.lru_cache(maxsize=64)
+def parse_relay_dna(data: bytes):
+    """Memoized `parser.relay_dna_block`."""
+    return parser.relay_dna_block(data, encoding='utf-8')
+
+@functools.lru_cache(maxsize=64)
+def parse_relay_id(data: bytes):
+    """Memoized `parser.relay_id_block`, as `relay_id_fields`."""
+    return relay_id_fields(parser.relay_id_block(data, encoding='utf-8'))
+
+
+# Configuration Blocks Requested Together During Auto-Configuration:
+# name -> (attribute, parser, memoized parser, individual autoconfig method)
+CONFIGURATION_BLOCKS = {
+    'fast_meter': (
+        'fast_meter_definition', parser.fast_meter_configuration_block,
+        parse_fast_meter_configuration, 'autoconfig_fastmeter',
+    ),
+    'fast_demand': (
+        'fast_demand_definition', parser.fast_meter_configuration_block,
+        parse_fast_meter_configuration, 'autoconfig_fastmeter_demand',
+    ),
+    'fast_peak_demand': (
+        'fast_peak_demand_definition', parser.fast_meter_configuration_block,
+        parse_fast_meter_configuration, 'autoconfig_fastmeter_peakdemand',
+    ),
+    'fast_operate': (
+        'fastOpDef', parser.fast_op_configuration_block,
+        parse_fast_op_configuration, 'autoconfig_fastoperate',
+    ),
+}
+
+
+# Define State and Request Sequencing Shared by the Blocking and Asynchronous
+# Clients
+class SELClientMixin():
+    """
+    Client Behavior which does not Depend on how the Relay is Reached.
+
+    Owns the relay's identification and configuration, the remembered access
+    level, and the Fast Operate commands prepared for the current Fast Operate
+    definition; classes using the mixin call `_init_shared_state` first.
+
+    Exchanges with the relay are written once, as "steps": generators which
+    yield each I/O operation the client must perform as a tuple of a client
+    method name and its arguments, and are sent back the method's result:
+
+    - `('_send', data)`                         -> None
+    - `('_read_to_prompt', prompt, timeout)`    -> bytes
+    - `('_read_eager',)`                        -> bytes
+    - `('_clear_input_buffer',)`                -> None
+
+    A step's return value is the result of the exchange. `SELClient` calls
+    each method directly and `AsyncSELClient` awaits each, both through their
+    `_run` method, so the two clients share a single implementation of every
+    request sequence.
+    """
+
+    # Fixed Attribute Layout (subclasses should declare their own `__slots__`)
+    __slots__ = (
+        'verbose', 'logger', '_debug', '_debug_print', 'timeout',
+        '__num_con_check__', '__inter_cmd_delay__', '__prompt_retries__',
+        '_verify_timeout',
+        'fid', 'bfid', 'cid', 'devid', 'partno', 'config',
+        'fast_meter_supported', 'fast_meter_demand_supported',
+        'fast_meter_peak_demand_supported', 'fast_operate_supported',
+        '_fm', '_fm_config_requests', '_fm_requests', 'fop_command_info',
+        '_fop_config_request', 'fmsg_command_info',
+        'fast_meter_definition', 'fast_demand_definition',
+        'fast_peak_demand_definition', 'dnaDef', 'fastOpDef',
+        '_config_responses', '_level', '_fop_commands',
+    )
+
+    def _init_shared_state(self, logger=None, verbose: bool = False,
+                           debug: bool = False, timeout: float = 60,
+                           conn_check: int = 5, cmd_delay: float = 0.025,
+                           prompt_retries: int = 3,
+                           verify_timeout: float = None):
+        """Apply the Client Options and Reset the Relay's Description."""
+        self.verbose = verbose
+        self.logger = logger
+        self.debug = debug
+
+        # Initialize Class Options
+        self.timeout = timeout
+        self.__num_con_check__ = conn_check
+        self.__inter_cmd_delay__ = cmd_delay
+        self.__prompt_retries__ = prompt_retries
+        self._verify_timeout = timeout if verify_timeout is None else (
+            verify_timeout
+        )
+
+        # The Access Level is Unknown Until Observed
+        self._level = None
+
+        # Define Basic Parameter Defaults
+        self.fid     = ''
+        self.bfid    = ''
+        self.cid     = ''
+        self.devid   = ''
+        self.partno  = ''
+        self.config  = ''
+
+        # Define Parameters to Indicate Whether Specific Commands are Supported
+        self.fast_meter_supported = False
+        self.fast_meter_demand_supported = False
+        self.fast_meter_peak_demand_supported = False
+        self.fast_operate_supported = False
+
+        # Define the Various Command Defaults
+        self._fm = list(FAST_METER_COMMAND_DEFAULTS)
+        self.fop_command_info = commands.FO_CONFIG_BLOCK
+        self.fmsg_command_info = commands.FAST_MSG_CONFIG_BLOCK
+        self._fop_commands = (None, {})
+        self._terminate_requests()
+
+        # Allocate Space for Relay Definition Responses
+        self.fast_meter_definition = None
+        self.fast_demand_definition = None
+        self.fast_peak_demand_definition = None
+        self.dnaDef = None
+        self.fastOpDef = None
+        self._config_responses = {}
+
+    # Bind the Debug Printer Once, so Disabled Debugging Costs Nothing per Read
+    @property
+    def debug(self):
+        """Control to Print Debugging Information."""
+        return self._debug
+
+    @debug.setter
+    def debug(self, debug: bool):
+        self._debug = bool(debug)
+        self._debug_print = debug_print if debug else discard_print
+
+    # Define Accessors for the (Configuration Command, Command) Pairs
+    @property
+    def fm_config_command_1(self):
+        """Fast Meter Configuration Block Command."""
+        return self._fm[0][0]
+
+    @property
+    def fm_command_1(self):
+        """Fast Meter Command."""
+        return self._fm[0][1]
+
+    @property
+    def fm_config_command_2(self):
+        """Fast Meter Demand Configuration Block Command."""
+        return self._fm[1][0]
+
+    @property
+    def fm_command_2(self):
+        """Fast Meter Demand Command."""
+        return self._fm[1][1]
+
+    @property
+    def fm_config_command_3(self):
+        """Fast Meter Peak Demand Configuration Block Command."""
+        return self._fm[2][0]
+
+    @property
+    def fm_command_3(self):
+        """Fast Meter Peak Demand Command."""
+        return self._fm[2][1]
+
+    def _known_access_level(self):
+        """Return the access level observed within `ACCESS_LEVEL_TTL`."""
+        if self._level is None:
+            return None
+        level, observed = self._level
+        if time.monotonic() - observed >= ACCESS_LEVEL_TTL:
+            return None
+        return level
+
+    def _remember_access_level(self, level):
+        """Record the access level observed now (`None` to forget it)."""
+        self._level = None if level is None else (level, time.monotonic())
+
+    # Fast Operate Commands Depend Only on the Fast Operate Definition, so Each
+    # Client Keeps the Commands Prepared for its Current Definition
+    def _prepare_fastop_command(self, control_type, control_point, command):
+        """Return the Fast Operate command, prepared once per definition."""
+        definition, prepared = self._fop_commands
+        if definition is not self.fastOpDef:
+            prepared = {}
+            self._fop_commands = (self.fastOpDef, prepared)
+        key = (control_type, control_point, command)
+        command_str = prepared.get(key)
+        if command_str is None:
+            command_str = commands.prepare_fastop_command(
+                control_type=control_type, control_point=control_point,
+                command=command, fastop_def=self.fastOpDef
+            )
+            prepared[key] = command_str
+        return command_str
+
+    # Define Step to Read All Data After a Command (and to next relay prompt)
+    def _command_response_steps(self, command, prompt_str=commands.PROMPT):
+        command = strip_line_endings(command)
+        invalid_size = len(INVALID_COMMAND_STR)
+        response = bytearray()
+        scan_from = 0   # Bytes Before this Offset have been Searched Already
+        i = 0
+        while ((response.find(command, scan_from) == -1)
+               and (i < self.__prompt_retries__)):
+            scan_from = max(0, len(response) - len(command) + 1)
+            invalid_from = max(0, len(response) - invalid_size + 1)
+            chunk = yield ('_read_to_prompt', prompt_str, None)
+            response.extend(chunk)
+            i = 0 if chunk else i + 1
+            # Check for Invalid Command Response from Relay (in New Data)
+            if response.find(INVALID_COMMAND_STR, invalid_from) != -1:
+                raise exceptions.InvalidCommand(
+                    f"Relay Reports Invalid Command: '{bytes(response)}'"
+                )
+        return bytes(response)
+
+    # Define Step to Read Until a "Clean" Prompt is Viewed
+    def _clean_prompt_steps(self):
+        """
+        Send Carriage Return Characters to Clean Prompt.
+
+        Strategy
+        --------
+
+        Send <CR><LF> three at a time, reading back all three prompts from
+        the combined reply, until a batch contains a "clean" prompt (giving
+        up after `conn_check` batches).
+        """
+        attempts = max(self.__num_con_check__, 1)
+        for _ in range(attempts):
+            yield ('_send', commands.CR3)  # Write all Three at Once
+            response = b''
+            for _ in range(3):
+                response += yield ('_read_to_prompt', commands.PROMPT, None)
+            self._debug_print('Clean prompt response:', response)
+            if parser.clean_prompt(response):
+                # Empty anything left in the buffer; this Keeps Draining only
+                # while Data Continues to Arrive, so a Quiet Relay Incurs no
+                # Delay
+                yield ('_clear_input_buffer',)
+                return
+        raise exceptions.ConnVerificationFail(
+            "Verification Failed: relay did not present a clean prompt after "
+            f"{attempts} attempts."
+        )
+
+    # Define Step to Identify Current Access Level
+    def _access_level_steps(self, refresh: bool = False):
+        if not refresh:
+            level = self._known_access_level()
+            if level is not None:
+                return level
+        # Retrieve the Prompt; the Level is Indicated by Characters Trailing it
+        yield ('_send', commands.CR)
+        resp = yield ('_read_to_prompt', commands.PROMPT, None)
+        resp += yield ('_read_eager',)
+        level = parse_access_level(resp)
+        if level[0] == 0:
+            # A Level-0 Prompt is Indistinguishable from one whose Trailing
+            # Characters have not yet Arrived, so Confirm with a Second Prompt
+            yield ('_send', commands.CR)
+            resp += yield ('_read_to_prompt', commands.PROMPT, None)
+            level = parse_access_level(resp)
+        self._remember_access_level(level)
+        return level
+
+    # Define Step to Return to Access Level 0
+    def _quit_steps(self):
+        yield ('_send', commands.QUIT)
+        yield ('_read_to_prompt', commands.LEVEL_0, None)
+        yield from self._clean_prompt_steps()
+        self._remember_access_level((0, ''))
+
+    # Define Step to Enter an Access Level, Answering any Password Prompt
+    def _elevate_steps(self, command: bytes, password: bytes, level: bytes):
+        yield ('_send', command)
+        if password is not None:
+            # Wait for the Prompt, Giving up as Verification Would
+            yield ('_read_to_prompt', commands.PASS_PROMPT,
+                   self._verify_timeout)
+            yield ('_send', password + commands.CR)
+        resp = yield ('_read_to_prompt', commands.LEVEL_0, None)
+        if b'Invalid' in resp:
+            self._debug_print("Log-In Failed")
+            self._remember_access_level(None)
+            return False
+        self._debug_print("Log-In Succeeded")
+        self._remember_access_level(commands.ACCESS_LEVELS[level])
+        return True
+
+    # Define Step to Access Level 1
+    def _access_level_1_steps(self, level_1_pass: bytes = commands.PASS_ACC,
+                              **kwargs):
+        level, _ = yield from self._access_level_steps()
+        if level == 1:
+            return True
+        self._debug_print("Logging in to ACC")
+        # Provide Password Only when Logging in
+        return (yield from self._elevate_steps(
+            commands.GO_ACC, level_1_pass if level == 0 else None,
+            commands.LEVEL_1
+        ))
+
+    # Define Step to Access Level 2
+    def _access_level_2_steps(self, level_2_pass: bytes = commands.PASS_2AC,
+                              **kwargs):
+        level, _ = yield from self._access_level_steps()
+        if level == 2:
+            return True
+        if level == 0:
+            if not (yield from self._access_level_1_steps( **kwargs )):
+                return False
+        self._debug_print("Logging in to 2AC")
+        return (yield from self._elevate_steps(
+            commands.GO_2AC, level_2_pass if level in [0, 1] else None,
+            commands.LEVEL_2
+        ))
+
+    # Define Step to Request the Relay Definition and ID Blocks Together; the
+    # Relay Answers in Turn. Returns Whether the Definition Block was Usable
+    def _definition_and_id_steps(self, verbose: bool = False):
+        yield ('_send', commands.RELAY_DEFINITION_REQUEST + commands.ID)
+        try:
+            yield from self._relay_definition_steps(verbose=self.debug)
+            definition_read = True
+        except exceptions.CommError:
+            definition_read = False
+        yield from self._id_block_steps(verbose=verbose, requested=True)
+        return definition_read
+
+    # Define Step to Read and Load the (Requested) Relay Definition Block
+    def _relay_definition_steps(self, verbose: bool = False):
+        response = yield from self._command_response_steps(
+            commands.RELAY_DEFINITION
+        )
+        self._config_responses['definition'] = response
+        if verbose:
+            definition = parser.relay_definition_block(response, verbose=True)
+        else:
+            definition = parse_relay_definition(response)
+        self._load_relay_definition(definition, verbose=verbose)
+
+    # Define Step to Read and Store the Relay ID Block
+    def _id_block_steps(self, verbose: bool = False, requested: bool = False):
+        if verbose:
+            debug_print("Reading Relay ID Block...")
+        if not requested:
+            yield ('_send', commands.ID)
+        response = yield from self._command_response_steps(commands.ID)
+        if self.debug:
+            id_fields = relay_id_fields(parser.relay_id_block(
+                response,
+                encoding='utf-8',
+                verbose=True
+            ))
+        else:
+            id_fields = parse_relay_id(response)
+        # Store Relay Information
+        (self.fid, self.bfid, self.cid,
+         self.devid, self.partno, self.config) = id_fields
+
+    # Define Method to Load the Relay Definition Block Results
+    def _load_relay_definition(self, definition: dict, verbose: bool = False):
+        # Load the Relay Definition Information and Request the Meter Blocks
+        fm_commands = definition['fmcommands'][:3]
+        self._fm[:len(fm_commands)] = fm_commands
+        if definition['fmmessagesup'] >= 1:
+            if verbose:
+                debug_print("Reading Fast Meter Definition Block...")
+            self.fast_meter_supported = True
+        if definition['fmmessagesup'] >= 2:
+            if verbose:
+                debug_print("Reading Fast Meter Demand Definition Block...")
+            self.fast_meter_demand_supported = True
+        if definition['fmmessagesup'] >= 3:
+            if verbose:
+                debug_print("Reading Fast Meter Peak Demand Definition Block...")
+            self.fast_meter_peak_demand_supported = True
+        # Interpret the Fast Operate Information if Present
+        if definition['fopcommandinfo'] != '':
+            if verbose:
+                debug_print("Reading Fast Operate Definition Block...")
+            self.fop_command_info     = definition['fopcommandinfo']
+            self.fast_operate_supported = True
+        # Interpret the Fast Message Information if Present
+        if definition['fmsgcommandinfo'] != '':
+            if verbose:
+                debug_print("Reading Fast Message Definition Block...")
+            self.fmsg_command_info    = definition['fmsgcommandinfo']
+        self._terminate_requests()
+
+    # Define Method to Prepare the Terminated (CR) Form of each Relay Command
+    def _terminate_requests(self):
+        self._fm_config_requests = [
+            config_command + commands.CR for config_command, _ in self._fm
+        ]
+        self._fm_requests = [command + commands.CR for _, command in self._fm]
+        self._fop_config_request = self.fop_command_info + commands.CR
+
+    # Define Method to List the (Name, Request) of each Supported Block
+    def _configuration_requests(self):
+        requests = []
+        if self.fast_meter_supported:
+            requests.append(('fast_meter', self._fm_config_requests[0]))
+        if self.fast_meter_demand_supported:
+            requests.append(('fast_demand', self._fm_config_requests[1]))
+        if self.fast_meter_peak_demand_supported:
+            requests.append(('fast_peak_demand', self._fm_config_requests[2]))
+        if self.fast_operate_supported:
+            requests.append(('fast_operate', self._fop_config_request))
+        return requests
+
+    # Define Step to Read the Configuration and DNA Blocks, after the Relay
+    # Definition; Returns the Names of Configuration Blocks which were
+    # Malformed, for the Client to Request Again on their Own
+    def _configuration_steps(self, verbose: bool = False, **kwargs):
+        pending = yield from self._request_configuration_blocks_steps(
+            verbose=self.debug
+        )
+        # Determine if Level 0, and Escalate Accordingly
+        if (yield from self._access_level_steps())[0] == 0:
+            # Access Level 1 Required to Request DNA
+            yield from self._access_level_1_steps( **kwargs )
+        # Request Relay ENA Block
+        # TODO
+        # Request Relay DNA Block
+        yield from self._dna_block_steps(verbose=verbose)
+        # Request Relay BNA Block
+        # TODO
+        return self._load_requested_configuration_blocks(pending)
+
+    # Define Step to Request every Supported Configuration Block at Once
+    def _request_configuration_blocks_steps(self, verbose: bool = False):
+        requests = self._configuration_requests()
+        if not requests:
+            return {}
+        # Write the Requests Together; the Relay Answers Each in Turn (the
+        # Prompt is Already Clean, Having Just Been Read, so Only Drain)
+        yield ('_clear_input_buffer',)
+        yield ('_send', b''.join(request for _, request in requests))
+        for name, _ in requests:
+            self._config_responses[name] = yield (
+                '_read_to_prompt', commands.PROMPT, None
+            )
+        # Parse in the Background while the Remaining Blocks are Requested
+        pending = {}
+        for name, _ in requests:
+            if verbose:
+                # Verbose Parsing Prints, so Keep it in Order
+                pending[name] = None
+            else:
+                pending[name] = parse_pool().submit(
+                    CONFIGURATION_BLOCKS[name][2],
+                    self._config_responses[name]
+                )
+        return pending
+
+    # Define Method to Load the Configuration Blocks Requested Earlier,
+    # Returning the Names of any which were Malformed
+    def _load_requested_configuration_blocks(self, pending: dict):
+        malformed = []
+        for name, future in pending.items():
+            attribute, parse, _, _ = CONFIGURATION_BLOCKS[name]
+            try:
+                if future is None:
+                    setattr(self, attribute, parse(
+                        self._config_responses[name],
+                        verbose=True
+                    ))
+                else:
+                    setattr(self, attribute, future.result())
+            except exceptions.CommError:
+                malformed.append(name)
+        return malformed
+
+    # Define Step to Read and Store the Relay DNA Block
+    def _dna_block_steps(self, verbose: bool = False):
+        yield from self._clean_prompt_steps()
+        if verbose:
+            debug_print("Reading Relay DNA Block...")
+        yield ('_send', commands.DNA)
+        response = yield from self._command_response_steps(commands.DNA)
+        self._config_responses['dna'] = response
+        if self.debug:
+            self.dnaDef = parser.relay_dna_block(
+                response,
+                encoding='utf-8',
+                verbose=True
+            )
+        else:
+            self.dnaDef = parse_relay_dna(response)
+
+    # Define Step to Request, Store, and Parse a Single Configuration Block
+    def _configuration_block_steps(self, name: str, request: bytes,
+                                   verbose: bool = False):
+        attribute, parse, parse_cached, _ = CONFIGURATION_BLOCKS[name]
+        yield from self._clean_prompt_steps()
+        yield ('_send', request)
+        response = yield ('_read_to_prompt', commands.PROMPT, None)
+        self._config_responses[name] = response
+        if verbose:
+            setattr(self, attribute, parse(response, verbose=True))
+        else:
+            setattr(self, attribute, parse_cached(response))
+
+
+# END
@@ -10,9 +10,15 @@ Supports:
 ################################################################################
 
 # Import Requirements
+import os
+import sys
 import time
-import math
+import queue
+import atexit
 import struct
+import logging
+import functools
+import logging.handlers
 from typing import AnyStr
 from enum import Enum
 
@@ -20,6 +26,16 @@ from selprotopy import exceptions
 
 INVALID_COMMAND_STR = b"Invalid Command"
 
+# Precompiled Layout for Big-Endian IEEE 4-Byte Floating Point Values
+IEEE_4_BYTE = struct.Struct('>f')
+
+# Bits of Every Byte Value, Least Significant First (and Reversed), so Digital
+# Banks are Expanded with a Single Lookup
+_BYTE_BITS = tuple(
+    tuple(bool(value >> bit & 1) for bit in range(8)) for value in range(256)
+)
+_BYTE_BITS_REVERSED = tuple(bits[::-1] for bits in _BYTE_BITS)
+
 
 class BreakerBitControlType(str, Enum):
     """Control Type for Remote Bits."""
@@ -69,6 +85,11 @@ def int_to_bool_list(number: int, byte_like: bool = False,
                 representation of the integer passed to the
                 function.
     """
+    # Byte-Like Values up to a Byte are Taken from the Lookup Tables
+    if byte_like and 0 <= number <= 0xff:
+        if reverse:
+            return list(_BYTE_BITS_REVERSED[number])
+        return list(_BYTE_BITS[number])
     bin_string = format(number, '04b')
     bin_list = [x == '1' for x in bin_string[::-1]]
     # Extend List of Bytes if Needed
@@ -81,8 +102,29 @@ def int_to_bool_list(number: int, byte_like: bool = False,
         bin_list.reverse()
     return bin_list
 
+# Define Simple Function to Round a Value to a Number of Significant Digits
+def round_total_digits(value: float, total_digits: int = 7):
+    """
+    Round a Value to a Total Number of Significant Digits.
+
+    Parameters
+    ----------
+    value:          float
+                    The value which should be rounded.
+    total_digits:   int, optional
+                    Number of digits (i.e. decimal accuracy) which
+                    should be retained, defaults to 7.
+
+    Returns
+    -------
+    float:          The rounded value.
+    """
+    # Formatting Rounds to Significant Digits in a Single (C) Operation
+    return float('%.*g' % (total_digits, value))
+
 # Define Simple Function to Cast Binary Representation of IEEE 4-Byte FPS
-def ieee_4_byte_fps(binary_bytes: bytes, total_digits: int = 7):
+def ieee_4_byte_fps(binary_bytes: bytes, total_digits: int = 7,
+                    offset: int = 0):
     """
     Convert 4-Bytes to IEEE Floating Point Value.
 
@@ -96,21 +138,22 @@ def ieee_4_byte_fps(binary_bytes: bytes, total_digits: int = 7):
                     to a float using the IEEE floating-point standard.
     total_digits:   int, optional
                     Number of digits (i.e. decimal accuracy) which
-                    should be evaluated, defaults to 7.
+                    should be evaluated, defaults to 7. Set to None
+                    to skip rounding.
+    offset:         int, optional
+                    Position of the 4 bytes within `binary_bytes`, so a
+                    value may be read in place from a larger message,
+                    defaults to 0.
 
     Returns
     -------
     float:          IEEE floating-point representation of the 4-byte
                     bytestring passed as an argument.
     """
-    # Define the Internal Functions to Utilize
-    def magnitude(x):
-        return 0 if x==0 else int(math.floor(math.log10(abs(x)))) + 1
-    def round_total_digits(x, digits=7):
-        return round(x, digits - magnitude(x))
-    # Perform Calculation
-    return round_total_digits(  x=struct.unpack('>f', binary_bytes)[0],
-                                digits=total_digits )
+    value = IEEE_4_BYTE.unpack_from(binary_bytes, offset)[0]
+    if total_digits is None:
+        return value
+    return round_total_digits(value, total_digits)
 
 # Define Function to Evaluate Checksum
 def eval_checksum(data: AnyStr, constrain: bool = False ):
@@ -137,7 +180,11 @@ def eval_checksum(data: AnyStr, constrain: bool = False ):
     """
     # Evaluate the sum
     if isinstance(data, str):
-        checksum = sum(map(ord, data))
+        try:
+            # Encoding Sums the Code Points in C, where they Fit in a Byte
+            checksum = sum(data.encode('latin-1'))
+        except UnicodeEncodeError:
+            checksum = sum(map(ord, data))
     else:
         checksum = sum(data)
     # Cap the Value if Needed
@@ -161,8 +208,8 @@ def retry(delay=0, fail_msg="Automatic Configuration Failed.",
                 except exceptions.MalformedByteArray as error:
                     if 'verbose' in kwargs.keys():
                         if bool(kwargs['verbose']):
-                            print(log_msg)
-                            print(error)
+                            debug_print(log_msg)
+                            debug_print(error)
                     # On exception, retry till count is exhausted
                     if cls.logger:
                         cls.logger.exception(log_msg, exc_info=error)
@@ -172,4 +219,67 @@ def retry(delay=0, fail_msg="Automatic Configuration Failed.",
         return wrapper
     return decorator
 
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """Enqueue Records Unformatted, Leaving all Formatting to the Listener."""
+
+    def prepare(self, record):
+        """Pass the Record Through Unchanged."""
+        return record
+
+@functools.lru_cache(maxsize=None)
+def _debug_logger():
+    # Start the Background Writer on First Use
+    records = queue.Queue()
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    listener = logging.handlers.QueueListener(records, handler)
+    listener.start()
+    atexit.register(listener.stop)
+    logger = logging.getLogger('selprotopy.debug')
+    logger.addHandler(_DeferredQueueHandler(records))
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+    return logger
+
+def _reset_debug_logger():
+    # The Background Writer does not Survive `fork`, so a Child Process Drops
+    # the Parent's Handler and Starts its Own Writer on First Use
+    logger = logging.getLogger('selprotopy.debug')
+    for handler in list(logger.handlers):
+        if isinstance(handler, _DeferredQueueHandler):
+            logger.removeHandler(handler)
+    _debug_logger.cache_clear()
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_debug_logger)
+
+def debug_print(*values):
+    """
+    Print Debugging Information from a Background Thread.
+
+    Accepts the same positional values as `print`. Values are queued as-is
+    and are converted to text and written to standard output by a separate
+    thread, so large responses never stall communications. All verbose and
+    debugging output of the package is printed this way, so it is written
+    in the order it was produced.
+    """
+    _debug_logger().debug(' '.join(['%s'] * len(values)), *values)
+
+def flush_debug_print():
+    """
+    Wait Until all Queued Debugging Information has been Written.
+
+    Call before printing directly to standard output to keep that output in
+    order with the information printed by `debug_print`.
+    """
+    # Nothing can be Queued Before the Background Writer is Started; Other
+    # Handlers Added to the Logger Write Synchronously
+    for handler in logging.getLogger('selprotopy.debug').handlers:
+        if isinstance(handler, _DeferredQueueHandler):
+            handler.queue.join()
+
+def discard_print(*values):
+    """Discard Debugging Information (stands in for `debug_print`)."""
+
 # END
@@ -43,8 +43,13 @@ class ChecksumFail(CommError):
 
 
 # Define Custom Exception to Indicate Connection Verification Failure
-class ConnVerificationFail(CommError):
-    """Communications could not be verified."""
+class ConnVerificationFail(CommError, ConnectionError):
+    """
+    Communications could not be verified.
+
+    The relay did not respond with a prompt while the connection was being
+    verified. Also a `ConnectionError`, so generic network handling applies.
+    """
 
 ###############################################################################
 
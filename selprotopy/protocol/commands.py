@@ -53,6 +53,17 @@ BNA = b"BNA" + CR
 QUIT   = b"QUI" + CR
 GO_ACC = b"ACC" + CR
 GO_2AC = b"2AC" + CR
+CR3    = CR * 3 # Three Carriage Returns, to Clean and Verify the Prompt
+
+# Define Terminated Binary Requests
+RELAY_DEFINITION_REQUEST = RELAY_DEFINITION + CR
+
+# Define Default (Configuration Command, Command) Pairs for each Fast Meter Type
+FAST_METER_COMMAND_DEFAULTS = (
+    (FM_CONFIG_BLOCK, FAST_METER_REGULAR),
+    (FM_DEMAND_CONFIG_BLOCK, FAST_METER_DEMAND),
+    (FM_PEAK_CONFIG_BLOCK, FAST_METER_PEAK_DEMAND),
+)
 
 # Define Default SEL Relay Passwords
 PASS_ACC = b"OTTER"
@@ -64,10 +75,28 @@ LEVEL_1 = b"=>"
 LEVEL_2 = b"=>>"
 LEVEL_C = b"==>>"
 PROMPT = CR + LEVEL_0
+
+# Define (Level, Description) Indicated by each Access Level Prompt
+ACCESS_LEVELS = {
+    LEVEL_C: (3, 'CAL'),
+    LEVEL_2: (2, '2AC'),
+    LEVEL_1: (1, 'ACC'),
+}
+# Longest Indicators First, so Each Prompt is Matched Whole
+RE_ACCESS_LEVEL = re.compile(b'|'.join(
+    re.escape(level) for level in sorted(ACCESS_LEVELS, key=len, reverse=True)
+))
 PASS_PROMPT = b"Password:"
+# Number of a Control Point (e.g. the `5` of `RB5`)
+RE_POINT_NUMBER = re.compile(r'\d+')
 
 
 ################################################################################
+# Requests for Each Numbered Event Record (the Event Number Plus 0x60)
+_EVENT_RECORD_REQUESTS = tuple(
+    bytes([0xA5, 0x60 + event_number]) for event_number in range(65)
+)
+
 # Define Simple Function to Evaluate Request String for Numbered Event Record
 def event_record_request(event_number: int):
     """
@@ -92,16 +121,11 @@ def event_record_request(event_number: int):
     Raises
     ------
     ValueError:     Raised when the requested event number is
-                    greater than 64.
+                    negative or greater than 64.
     """
-    if event_number <= 64:
-        # Prepare leading portion of request
-        request = bytes.fromhex('A5')
-        # Append the event number plus the minimum event command
-        request += hex(96 + event_number)
-        return request
-    else:
-        raise ValueError("Event number may not be greater than 64.")
+    if 0 <= event_number <= 64:
+        return _EVENT_RECORD_REQUESTS[event_number]
+    raise ValueError("Event number must be between 0 and 64.")
 
 ################################################################################
 # Define Function to Prepare Fast Operate Command
@@ -131,7 +155,10 @@ def prepare_fastop_command(
     """
     # Prepare the Point Number
     if isinstance(control_point, str):
-        control_point = int(re.findall(r'(\d+)',control_point)[0])
+        point_number = RE_POINT_NUMBER.search(control_point)
+        if point_number is None:
+            raise ValueError("Invalid control point")
+        control_point = int(point_number.group())
     # Verify the Command Type
     if command.lower() not in ['set', 'clear', 'pulse', 'open', 'close', 'trip']:
         # Indicate invalid command type
@@ -154,7 +181,6 @@ def prepare_fastop_command(
         remote_bit_def = fastop_def['remotebitconfig']
         control_point_def = remote_bit_def[control_point - 1]
         control = control_point_def[command_opt]
-        print("control", control)
     except KeyError as err:
         raise ValueError("Improper command type for control point.") from err
     op_validation = (control * 4 + 1) & 0xff
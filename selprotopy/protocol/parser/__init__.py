@@ -10,10 +10,13 @@ Supports:
 ################################################################################
 
 from typing import AnyStr, List
+from struct import error as StructError
 
 # Local Imports
 from selprotopy.protocol import commands
-from selprotopy.common import int_to_bool_list, eval_checksum
+from selprotopy.common import (
+    int_to_bool_list, eval_checksum, round_total_digits, debug_print
+)
 from selprotopy.exceptions import MalformedByteArray, ChecksumFail
 from selprotopy.exceptions import MissingA5Head, DnaDigitalsMisMatch
 from selprotopy.protocol.parser import common
@@ -50,7 +53,7 @@ def _cast_bytearray(data: AnyStr, debug: bool = True):
     if offset == -1:
         # Indicate that response is missing 'A5' binary heading
         if debug:
-            print("Debug Cast Data:", data )
+            debug_print("Debug Cast Data:", data )
         raise MissingA5Head(
             "Invalid response request; missing 'A5' binary heading."
         )
@@ -68,12 +71,10 @@ def _cast_bytearray(data: AnyStr, debug: bool = True):
 # Define Clear Prompt Interpreter
 def clean_prompt(data: AnyStr, encoding: str = 'utf-8' ):
     """Repeatedly use Carriage-Returns to Clear the Prompt for new Commands."""
-    if encoding:
-        # Decode Bytes
-        try:
-            data = data.decode(encoding)
-        except UnicodeDecodeError:
-            pass
+    if isinstance(data, (bytes, bytearray)):
+        # The Prompt Characters are ASCII, so Bytes in any ASCII-Compatible
+        # `encoding` are Searched Directly (Decoding may Fail on Binary Data)
+        return common.RE_CLEAN_PROMPT_BYTES.search(data) is not None
     return common.RE_CLEAN_PROMPT_CHARS.search(data) is not None
 
 ################################################################################
@@ -138,9 +139,9 @@ def relay_id_block(data: AnyStr, encoding: str = '', byteorder: str = 'big',
             # Store Empty Results
             results[id_key] = ''
             if verbose:
-                print(f'Unable to determine {id_key} parameter from relay ID.')
+                debug_print(f'Unable to determine {id_key} parameter from relay ID.')
         except Exception:
-            print(id_string, re_param.findall(id_string))
+            debug_print(id_string, re_param.findall(id_string))
     # Return Parsed ID Components
     return results
 
@@ -217,7 +218,7 @@ def relay_dna_block(data: AnyStr, encoding: str = '', byteorder: str = 'big',
                     raise ChecksumFail(f"Invalid Checksum Found for {line}")
                 binaries.append( row )
             except Exception:
-                if verbose: print(f"Couldn't parse line: {line}")
+                if verbose: debug_print(f"Couldn't parse line: {line}")
     return binaries
 
 # Define Relay Status Bit Name Parser
@@ -265,7 +266,7 @@ def RelayBnaBlock(data: AnyStr, encoding: str = '', verbose: bool = False):
                 bit_names.append( names )
             except Exception:
                 if verbose:
-                    print(f"Couldn't parse line: {line}")
+                    debug_print(f"Couldn't parse line: {line}")
         else:
             break
         return bit_names
@@ -309,12 +310,12 @@ def relay_definition_block(data: AnyStr, verbose: bool = False):
         struct['fmcommandinfo'] = []
         struct['statusflaginfo']= []
         if verbose:
-            print("Generic Relay Definition Block Information")
-            print("Command:",struct['command'])
-            print("Length:",struct['length'])
-            print("Number of Supported Protocols:",struct['numprotocolsup'])
-            print("Fast Meter Message Support:",struct['fmmessagesup'])
-            print("Status Flag Support:",struct['statusflagssup'])
+            debug_print("Generic Relay Definition Block Information")
+            debug_print("Command:",struct['command'])
+            debug_print("Length:",struct['length'])
+            debug_print("Number of Supported Protocols:",struct['numprotocolsup'])
+            debug_print("Fast Meter Message Support:",struct['fmmessagesup'])
+            debug_print("Status Flag Support:",struct['statusflagssup'])
         # Iterate over the Fast Meter Commands
         ind = 6
         for _ in range(struct['fmmessagesup']):
@@ -323,10 +324,15 @@ def relay_definition_block(data: AnyStr, verbose: bool = False):
             data_dict['command'] = bytes(byre_array[ind+2:ind+4])
             struct['fmcommandinfo'].append(data_dict)
             ind += 4
+        # Also Provide the Commands as Ready-to-Use (Config, Command) Pairs
+        struct['fmcommands'] = tuple(
+            (info['configcommand'], info['command'])
+            for info in struct['fmcommandinfo']
+        )
         struct['fmtype'] = byre_array[ind]
         if verbose:
-            print("Fast Meter Command Information")
-            print(struct['fmcommandinfo'],'\n',struct['fmtype'])
+            debug_print("Fast Meter Command Information")
+            debug_print(struct['fmcommandinfo'],'\n',struct['fmtype'])
         ind += 1
         # Iterate Over the Status Flag Commands
         for _ in range(struct['statusflagssup']):
@@ -336,8 +342,8 @@ def relay_definition_block(data: AnyStr, verbose: bool = False):
             struct['statusflaginfo'].append(data_dict)
             ind += 8
         if verbose:
-            print("Status Flag Information")
-            print(struct['statusflaginfo'])
+            debug_print("Status Flag Information")
+            debug_print(struct['statusflaginfo'])
         # Manage Protocol Specific Data
         struct['protocols'] = []
         struct['fopcommandinfo']  = ''
@@ -388,10 +394,10 @@ def relay_definition_block(data: AnyStr, verbose: bool = False):
                     'type'  : 'R6_SEL'
                 }
             if verbose:
-                print('Protocol Type:',proto_desc['type'])
+                debug_print('Protocol Type:',proto_desc['type'])
                 if 'fast_op_en' in proto_desc.keys():
-                    print('Fast Operate Enable:',proto_desc['fast_op_en'])
-                    print('Fast Message Enable:',proto_desc['fast_msg_en'])
+                    debug_print('Fast Operate Enable:',proto_desc['fast_op_en'])
+                    debug_print('Fast Message Enable:',proto_desc['fast_msg_en'])
             struct['protocols'].append(proto_desc)
             ind += 2
         # Return Resultant Structure
@@ -446,43 +452,32 @@ def fast_meter_configuration_block(data: AnyStr, byteorder: str = 'big',
         struct['numdigitalbank']= byte_arr[8]
         struct['numcalcblocks'] = byte_arr[9]
         # Determine Offsets
-        struct['analogchanoff'] = int.from_bytes(
-            byte_arr[10:12],
-            byteorder=byteorder,
-            signed=signed
-        )
-        struct['timestmpoffset']= int.from_bytes(
-            byte_arr[12:14],
-            byteorder=byteorder,
-            signed=signed
-        )
-        struct['digitaloffset'] = int.from_bytes(
-            byte_arr[14:16],
-            byteorder=byteorder,
-            signed=signed
-        )
+        int_16 = common.INT_16_LAYOUTS[(byteorder, bool(signed))]
+        (struct['analogchanoff'], struct['timestmpoffset'],
+         struct['digitaloffset']) = common.FM_CONFIG_OFFSET_LAYOUTS[
+            (byteorder, bool(signed))
+        ].unpack_from(byte_arr, 10)
         # Iteratively Interpret the Analog Channels
         ind = 16
         struct['analogchannels'] = []
         for _ in range(struct['numanalogins']):
             data_dict = {}
-            bytstr = bytes(byte_arr[ind:ind+6])
-            data_dict['name'] = ''
-            for byte in bytstr:
-                char = chr(byte)
-                if byte != 0:
-                    data_dict['name']    += char
-            ind += 6
-            data_dict['channeltype'] = byte_arr[ind]
-            data_dict['factortype']  = byte_arr[ind+1]
-            data_dict['scaleoffset'] = int.from_bytes(
-                byte_arr[ind:ind+2],
-                byteorder=byteorder,
-                signed=signed
+            name, channel_type, factor_type = (
+                common.ANALOG_CHANNEL_LAYOUT.unpack_from(byte_arr, ind)
             )
+            data_dict['name'] = name.replace(b'\x00', b'').decode('latin-1')
+            ind += 6
+            data_dict['channeltype'] = channel_type
+            data_dict['factortype']  = factor_type
+            data_dict['scaleoffset'] = int_16.unpack_from(byte_arr, ind)[0]
             ind += 4
             # Append the Analog Channel Description:
             struct['analogchannels'].append( data_dict )
+        # Prepare to Unpack all Analog Samples Together, where Possible
+        struct['analoglayout'] = common.analog_layout(
+            struct['analogchannels'],
+            struct['numsampperchan']
+        )
         # Iteratively Interpret the Calculation Blocks
         struct['calcblocks'] = []
         for _ in range(struct['numcalcblocks']):
@@ -552,22 +547,22 @@ def fast_meter_configuration_block(data: AnyStr, byteorder: str = 'big',
             # Store Dictionary
             struct['calcblocks'].append(data_dict)
         if verbose:
-            print("Generic Fast Meter Configuration Block Information")
-            print("Command:", struct['command'])
-            print("Message Length:",struct['length'])
-            print("Number of Status Flags:",struct['numstatusflags'])
-            print("Scale Factor Location:",struct['scalefactloc'])
-            print("Number of Scale Factors:",struct['numscalefact'])
-            print("Number of Analog Inputs:",struct['numanalogins'])
-            print("Number of Samples per Channel:",struct['numsampperchan'])
-            print("Number of Digital Banks:",struct['numdigitalbank'])
-            print("Number of Calculation Blocks:",struct['numcalcblocks'])
-            print("Analog Channel Offset:",struct['analogchanoff'])
-            print("Time Stamp Offset:",struct['timestmpoffset'])
-            print("Digital Channel Offset:",struct['digitaloffset'])
+            debug_print("Generic Fast Meter Configuration Block Information")
+            debug_print("Command:", struct['command'])
+            debug_print("Message Length:",struct['length'])
+            debug_print("Number of Status Flags:",struct['numstatusflags'])
+            debug_print("Scale Factor Location:",struct['scalefactloc'])
+            debug_print("Number of Scale Factors:",struct['numscalefact'])
+            debug_print("Number of Analog Inputs:",struct['numanalogins'])
+            debug_print("Number of Samples per Channel:",struct['numsampperchan'])
+            debug_print("Number of Digital Banks:",struct['numdigitalbank'])
+            debug_print("Number of Calculation Blocks:",struct['numcalcblocks'])
+            debug_print("Analog Channel Offset:",struct['analogchanoff'])
+            debug_print("Time Stamp Offset:",struct['timestmpoffset'])
+            debug_print("Digital Channel Offset:",struct['digitaloffset'])
         # Return the Generated Structure
         return struct
-    except IndexError as err:
+    except (IndexError, StructError) as err:
         raise ValueError("Invalid data string response") from err
 
 # Define Function to Parse a Fast Operate Configuration Block
@@ -609,9 +604,9 @@ def fast_op_configuration_block(data: AnyStr, byteorder: str = 'big',
         struct['command']       = bytes(byte_array[:2])
         struct['length']        = byte_array[2]
         struct['numbreakers']   = byte_array[3]
-        struct['numremotebits'] = int.from_bytes( byte_array[4:6],
-                                                  byteorder=byteorder,
-                                                  signed=signed )
+        struct['numremotebits'] = common.INT_16_LAYOUTS[
+            (byteorder, bool(signed))
+        ].unpack_from(byte_array, 4)[0]
         struct['pulsesupported']= byte_array[6]
         _                       = byte_array[7]  # reservedpoint
         # Iterate Over Breaker Bits
@@ -637,15 +632,15 @@ def fast_op_configuration_block(data: AnyStr, byteorder: str = 'big',
             # Append Structure
             struct['remotebitconfig'].append(remotebitstruct)
         if verbose:
-            print("Generic Fast Operate Configuration Block Information")
-            print("Command:", struct['command'])
-            print("Message Length:",struct['length'])
-            print("Number of Breakers:",struct['breakerconfig'])
-            print("Number of Remote Bits:",struct['numremotebits'])
-            print("Pulse Command Supported:", int(struct['pulsesupported'])==1)
+            debug_print("Generic Fast Operate Configuration Block Information")
+            debug_print("Command:", struct['command'])
+            debug_print("Message Length:",struct['length'])
+            debug_print("Number of Breakers:",struct['breakerconfig'])
+            debug_print("Number of Remote Bits:",struct['numremotebits'])
+            debug_print("Pulse Command Supported:", int(struct['pulsesupported'])==1)
         # Return Structure
         return struct
-    except IndexError as err:
+    except (IndexError, StructError) as err:
         raise ValueError("Invalid data string response") from err
 ################################################################################
 
@@ -697,14 +692,19 @@ def fast_meter_block(data: AnyStr, definition: dict, dna_def: List[List[str]],
         struct['length']        = byte_array[2]
         struct['statusflag']    = byte_array[3:3+definition['numstatusflags']]
         if verbose:
-            print("Generic Fast Meter Block Information")
-            print("Command:", struct['command'])
-            print("Message Length:",struct['length'])
-            print("Status Flag:",struct['statusflag'])
+            debug_print("Generic Fast Meter Block Information")
+            debug_print("Command:", struct['command'])
+            debug_print("Message Length:",struct['length'])
+            debug_print("Status Flag:",struct['statusflag'])
         # Handle Analog Points
         struct['analogs'] = {}
         ind = definition['analogchanoff']
         samples = definition['numsampperchan']
+        # Unpack Every Sample at Once when the Channels Allow it
+        layout = definition.get('analoglayout')
+        values = None
+        if layout is not None:
+            values = iter(layout.unpack_from(byte_array, ind))
         # Iterate over Samples
         for samp_n in range(samples):
             # Iterate over Analogs
@@ -716,10 +716,14 @@ def fast_meter_block(data: AnyStr, definition: dict, dna_def: List[List[str]],
                 # Handle Non-Scaling Values
                 if scale_type == 255:
                     scale = 1
-                # Extract Value to be Interpreted
-                value = bytes(byte_array[ind:ind+size])
-                # Apply Formatting
-                value = common.ANALOG_TYPE_FORMATTERS[type]( value )
+                if values is None:
+                    # Interpret the Value in Place
+                    value = common.ANALOG_TYPE_DECODERS[type]( byte_array, ind )
+                elif type == 1:
+                    # Floating Point Values are Rounded as when Decoded Alone
+                    value = round_total_digits(next(values))
+                else:
+                    value = next(values)
                 # Evaluate Result
                 analog_data = value*scale
                 # Handle Different Analog Sample Types
@@ -741,7 +745,7 @@ def fast_meter_block(data: AnyStr, definition: dict, dna_def: List[List[str]],
                     else:
                         struct['analogs'][name].append(analog_data)
                 ind += size
-                if verbose: print("Analog {}: {}".format(name,analog_data))
+                if verbose: debug_print("Analog {}: {}".format(name,analog_data))
         # Iteratively Handle Digital Points
         struct['digitals'] = {}
         ind = definition['digitaloffset']
@@ -764,8 +768,8 @@ def fast_meter_block(data: AnyStr, definition: dict, dna_def: List[List[str]],
         struct['digitals'].pop('*')
         # Return the Resultant Structure
         return struct
-    except IndexError:
-        raise ValueError("Invalid data string response")
+    except (IndexError, StructError) as err:
+        raise ValueError("Invalid data string response") from err
 ################################################################################
 
 # END
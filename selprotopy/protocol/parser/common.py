@@ -11,6 +11,7 @@ Supports:
 
 # Import Requirements
 import re
+from struct import Struct
 
 from selprotopy.common import ieee_4_byte_fps
 
@@ -18,6 +19,7 @@ from selprotopy.common import ieee_4_byte_fps
 RE_CLEAN_PROMPT_CHARS = re.compile(
     r'\=\>{0,2}\r\n|\>{0,2}\r\n\=|\r\n\=\>{0,2}|\n\=\>{0,2}\r'
 )
+RE_CLEAN_PROMPT_BYTES = re.compile(RE_CLEAN_PROMPT_CHARS.pattern.encode())
 
 # Define DNA Control Character String for RegEx
 RE_DNA_CONTROL = re.compile(r'\>?.*DNA')
@@ -60,4 +62,62 @@ ANALOG_TYPE_FORMATTERS = {
     1: ieee_4_byte_fps, # 4-Byte IEEE FPS
     2: None, # 8-Byte IEEE FPS
     3: None, # 8-Byte Time Stamp
-}
\ No newline at end of file
+}
+
+# Define Look-Up-Table of Functions Decoding Analog Channel Types in Place, Given
+# the Whole Message and the Value's Offset: (buffer, offset) -> value
+ANALOG_TYPE_DECODERS = {
+    0: lambda buffer, offset: UINT_16_BE.unpack_from(buffer, offset)[0],
+    1: lambda buffer, offset: ieee_4_byte_fps(buffer, offset=offset),
+    2: None, # 8-Byte IEEE FPS
+    3: None, # 8-Byte Time Stamp
+}
+
+# Define Look-Up-Table of Struct Codes for the Analog Channel Types which may be
+# Unpacked Together, with a Single Layout Covering Every Sample
+ANALOG_TYPE_CODES = {
+    0: 'H', # 2-Byte Integer
+    1: 'f', # 4-Byte IEEE FPS
+}
+
+def analog_layout(channels: list, samples: int):
+    """
+    Prepare a Single Layout to Unpack every Analog Sample of a Fast Meter.
+
+    Parameters
+    ----------
+    channels:   list of dict
+                Analog channel descriptions from the fast meter
+                configuration block.
+    samples:    int
+                Number of samples per channel.
+
+    Returns
+    -------
+    Struct:     Layout of all analog samples, or None when a channel is
+                scaled or of a type which must be decoded on its own.
+    """
+    codes = []
+    for channel in channels:
+        if (channel['factortype'] != 255 or
+                channel['channeltype'] not in ANALOG_TYPE_CODES):
+            return None
+        codes.append(ANALOG_TYPE_CODES[channel['channeltype']])
+    return Struct('>' + ''.join(codes) * samples)
+
+# Define Precompiled Binary Layouts, Keyed by (byteorder, signed)
+def _layouts(signed_format: str, unsigned_format: str):
+    return {
+        (byteorder, signed): Struct(
+            prefix + (signed_format if signed else unsigned_format)
+        )
+        for byteorder, prefix in (('big', '>'), ('little', '<'))
+        for signed in (True, False)
+    }
+
+INT_16_LAYOUTS = _layouts('h', 'H')
+UINT_16_BE = INT_16_LAYOUTS[('big', False)]
+# Analog Channel, Time Stamp, and Digital Offsets of a Fast Meter Configuration
+FM_CONFIG_OFFSET_LAYOUTS = _layouts('hhh', 'HHH')
+# Analog Channel Name, Channel Type, and Scale Factor Type
+ANALOG_CHANNEL_LAYOUT = Struct('6sBB')
@@ -0,0 +1,121 @@
+################################################################################
+"""
+selprotopy: A Protocol Binding Suite for the SEL Protocol Suite.
+
+Supports:
+    - SEL Fast Meter
+    - SEL Fast Message
+    - SEL Fast Operate
+
+Relay configuration blocks only change with firmware or settings updates, so
+the raw responses gathered by auto-configuration may be stored on disk and
+reused when reconnecting to the same relay.
+"""
+################################################################################
+
+# Configuration Cache Support: Skip the Handshake when Reconnecting
+import os
+import re
+import json
+import time
+import base64
+from typing import Optional
+
+# Cache Entries Older than this (in seconds) are Ignored by Default
+DEFAULT_TTL = 24 * 60 * 60
+
+
+def cache_directory():
+    """Identify the Directory where Cache Entries are Stored."""
+    root = os.environ.get('XDG_CACHE_HOME') or os.path.join(
+        os.path.expanduser('~'), '.cache'
+    )
+    return os.path.join(root, 'selprotopy')
+
+
+def _entry_path(key: str, directory: Optional[str] = None):
+    # Restrict the Key to Characters which are Safe in a File Name
+    return os.path.join(
+        directory or cache_directory(),
+        re.sub(r'[^\w.-]', '_', key) + '.json'
+    )
+
+
+def load_entry(key: str, ttl: float = DEFAULT_TTL,
+               directory: Optional[str] = None):
+    """
+    Load a Cache Entry.
+
+    Parameters
+    ----------
+    key:        str
+                Key identifying the relay endpoint.
+    ttl:        float, optional
+                Maximum age (in seconds) of an entry which may be used.
+    directory:  str, optional
+                Directory holding the entries, defaults to the one given by
+                `cache_directory`.
+
+    Returns
+    -------
+    dict:       The stored entry with its responses decoded to bytes, or None
+                when no usable entry exists.
+    """
+    try:
+        with open(_entry_path(key, directory), 'r', encoding='utf-8') as cache_file:
+            entry = json.load(cache_file)
+        if time.time() - entry['timestamp'] > ttl:
+            return None
+        entry['responses'] = {
+            name: base64.b64decode(response)
+            for name, response in entry['responses'].items()
+        }
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        # Missing or Damaged Entries are Simply Treated as Absent
+        return None
+    return entry
+
+
+def store_entry(key: str, entry: dict, directory: Optional[str] = None):
+    """
+    Store a Cache Entry.
+
+    Parameters
+    ----------
+    key:        str
+                Key identifying the relay endpoint.
+    entry:      dict
+                Entry to store, its `responses` item must map names to the
+                raw (bytes) responses received from the relay.
+    directory:  str, optional
+                Directory holding the entries, defaults to the one given by
+                `cache_directory`.
+    """
+    entry = dict(entry)
+    entry['timestamp'] = time.time()
+    entry['responses'] = {
+        name: base64.b64encode(response).decode('ascii')
+        for name, response in entry['responses'].items()
+    }
+    path = _entry_path(key, directory)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write Atomically so Concurrent Clients Never Read a Partial Entry
+        temporary = f'{path}.{os.getpid()}.tmp'
+        with open(temporary, 'w', encoding='utf-8') as cache_file:
+            json.dump(entry, cache_file)
+        os.replace(temporary, path)
+    except OSError:
+        # Caching is an Optimization; Never Fail the Caller for it
+        pass
+
+
+def remove_entry(key: str, directory: Optional[str] = None):
+    """Remove a Cache Entry, if it Exists."""
+    try:
+        os.remove(_entry_path(key, directory))
+    except OSError:
+        pass
+
+
+# END
@@ -16,7 +16,36 @@ telnetlib.Telnet.process_rawq = process_rawq
 ################################################################################
 
 # Socket Support: We need to read without blocking forever!
+import time
 import socket
+import selectors
+
+# Receive Buffer Requested for Relay Connections (bytes)
+RECEIVE_BUFFER_SIZE = 1 << 20
+
+# Most Data Taken per `recv` Call; the GIL is Released While Waiting in `recv`
+# and Re-Acquired Once per Chunk, so Large Chunks Keep Threads Concurrent
+RECV_CHUNK_SIZE = 1 << 16
+
+def tune_socket(sock: socket.socket, nodelay: bool = True):
+    """
+    Prepare a TCP Socket for Request/Response Traffic.
+
+    Disables Nagle's algorithm (unless `nodelay` is False), so short commands
+    are sent immediately rather than held back to coalesce with later writes,
+    and enlarges the receive buffer to absorb bursts of response data. Sockets
+    which do not support the options (e.g. Unix sockets) are left as-is.
+    """
+    try:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, int(nodelay))
+    except (OSError, AttributeError):
+        pass
+    try:
+        sock.setsockopt(
+            socket.SOL_SOCKET, socket.SO_RCVBUF, RECEIVE_BUFFER_SIZE
+        )
+    except (OSError, AttributeError):
+        pass
 
 def socket_read(sock: socket.socket):
     """Read from the socket without blocking indefinitely."""
@@ -40,3 +69,266 @@ def socket_read(sock: socket.socket):
     # Finished Collecting
     sock.settimeout(timeout)
     return data
+
+
+# Telnet Protocol Bytes
+IAC  = bytes([255]) # Interpret As Command
+DONT = bytes([254])
+DO   = bytes([253])
+WONT = bytes([252])
+WILL = bytes([251])
+SB   = bytes([250]) # Subnegotiation Begin
+SE   = bytes([240]) # Subnegotiation End
+
+class TelnetDecoder():
+    """
+    Incremental Decoder for Data Received from a Telnet Server.
+
+    Strips telnet commands from the received data while retaining null
+    characters (SEL Protocol requires them). Data is scanned a whole chunk at
+    a time, and all option negotiation is refused.
+
+    Attributes
+    ----------
+    cooked:     bytearray
+                Decoded data which has not yet been consumed by the reader.
+    """
+
+    __slots__ = ('cooked', '_raw', '_in_subnegotiation')
+
+    def __init__(self):
+        """Prepare the Decoder."""
+        self.cooked = bytearray()   # Interpreted, not yet Read
+        self._raw = bytearray()     # Received, not yet Interpreted
+        self._in_subnegotiation = False
+
+    def feed(self, data: bytes):
+        """
+        Decode a Chunk of Received Data.
+
+        Parameters
+        ----------
+        data:       bytes
+                    Raw data as received from the connection.
+
+        Returns
+        -------
+        bytes:      Negotiation replies which must be written back to the
+                    server, empty when no reply is required.
+        """
+        raw = self._raw
+        # Plain Data (the Usual Case) Needs no Interpretation
+        if not raw and not self._in_subnegotiation and IAC not in data:
+            self.cooked += data
+            return b''
+        # Jump Between IAC Characters Rather than Stepping Through Each Byte
+        raw += data
+        replies = b''
+        pos = 0
+        while True:
+            index = raw.find(IAC, pos)
+            if index == -1:
+                if not self._in_subnegotiation:
+                    self.cooked += raw[pos:]
+                pos = len(raw)
+                break
+            if not self._in_subnegotiation:
+                self.cooked += raw[pos:index]
+            command = raw[index+1:index+2]
+            if command in (DO, DONT, WILL, WONT):
+                option = raw[index+2:index+3]
+                if not option:
+                    pos = index  # Incomplete Sequence, Wait for the Rest
+                    break
+                # Refuse all Option Negotiation
+                reply = WONT if command in (DO, DONT) else DONT
+                replies += IAC + reply + option
+                pos = index + 3
+                continue
+            if not command:
+                pos = index  # Incomplete Sequence, Wait for the Rest
+                break
+            if command == IAC:
+                if not self._in_subnegotiation:
+                    self.cooked += IAC
+            elif command == SB:
+                self._in_subnegotiation = True
+            elif command == SE:
+                self._in_subnegotiation = False
+            pos = index + 2
+        del raw[:pos]
+        return replies
+
+    def take(self, size: int):
+        """Remove and Return the First `size` Bytes of Decoded Data."""
+        # Copy Once, Directly from the Buffer (released before it is resized)
+        with memoryview(self.cooked) as view:
+            data = bytes(view[:size])
+        del self.cooked[:size]
+        return data
+
+    def take_until(self, match: bytes, scan_from: int = 0):
+        """
+        Remove and Return Decoded Data Through the First `match`, if Present.
+
+        Returns
+        -------
+        bytes:      Data up to and including `match`, or None when `match`
+                    has not yet been received.
+        """
+        index = self.cooked.find(match, scan_from)
+        if index == -1:
+            return None
+        return self.take(index + len(match))
+
+
+class TelnetSocket():
+    """
+    Telnet Connection Implemented Directly on a Socket.
+
+    A lightweight replacement for `telnetlib.Telnet` (deprecated as of Python
+    3.11) offering the `write`, `read_until`, and `read_very_eager` methods
+    used by `SELClient`. Received data is decoded with `TelnetDecoder`.
+
+    Parameters
+    ----------
+    host:       str
+                Host name or IP address of the relay.
+    port:       int, optional
+                TCP port of the relay's telnet server, defaults to 23.
+    timeout:    float, optional
+                Timeout (in seconds) used while establishing the connection.
+    nodelay:    bool, optional
+                Control to disable Nagle's algorithm on the connection,
+                defaults to True.
+    """
+
+    __slots__ = ('_owner', 'sock', 'eof', '_decoder', '_selector')
+
+    def __init__(self, host: str, port: int = 23, timeout: float = None,
+                 nodelay: bool = True):
+        """Connect to the Telnet Server."""
+        self._attach(
+            socket.create_connection((host, port), timeout), nodelay=nodelay
+        )
+
+    @classmethod
+    def from_socket(cls, sock: socket.socket, owner=None,
+                    nodelay: bool = True):
+        """
+        Adopt an Already-Connected Socket.
+
+        Used to take over the socket of an existing `telnetlib.Telnet`
+        connection; any data buffered by `telnetlib` is not carried over.
+
+        Parameters
+        ----------
+        sock:       socket.socket
+                    Connected socket to adopt.
+        owner:      object, optional
+                    Object the socket was taken from, kept alive alongside
+                    this connection (`telnetlib.Telnet` closes its socket
+                    when garbage collected).
+        nodelay:    bool, optional
+                    Control to disable Nagle's algorithm on the socket,
+                    defaults to True.
+        """
+        telnet = cls.__new__(cls)
+        telnet._attach(sock, owner, nodelay)
+        return telnet
+
+    def _attach(self, sock: socket.socket, owner=None, nodelay: bool = True):
+        self._owner = owner
+        self.sock = sock
+        tune_socket(sock, nodelay)
+        self.sock.settimeout(None)
+        self.eof = False
+        self._decoder = TelnetDecoder()
+        # Wait for Data with a Selector, Leaving the Socket Blocking so Each
+        # Read Needs no Timeout Changes
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(sock, selectors.EVENT_READ)
+
+    def __enter__(self):
+        """Enter Context."""
+        return self
+
+    def __exit__(self, *args):
+        """Close Connection when Leaving Context."""
+        self.close()
+
+    def get_socket(self):
+        """Return the Underlying Socket."""
+        return self.sock
+
+    def fileno(self):
+        """Return the File Descriptor of the Underlying Socket."""
+        return self.sock.fileno()
+
+    def close(self):
+        """Close the Connection."""
+        self.eof = True
+        self._selector.close()
+        self.sock.close()
+
+    def write(self, buffer: bytes):
+        """Write Bytes to the Connection, Escaping any IAC Characters."""
+        # Commands Rarely Contain IAC, so Usually the Buffer is Sent as-is
+        if IAC in buffer:
+            buffer = buffer.replace(IAC, IAC + IAC)
+        self.sock.sendall(buffer)
+
+    def _fill(self, timeout: float = None):
+        # Wait for Data, Returning Whether any Arrived
+        if self.eof:
+            return False
+        if not self._selector.select(timeout):
+            return False
+        data = self.sock.recv(RECV_CHUNK_SIZE)
+        if not data:
+            self.eof = True
+            return False
+        replies = self._decoder.feed(data)
+        if replies:
+            self.sock.sendall(replies)
+        return True
+
+    def read_until(self, match: bytes, timeout: float = None):
+        """
+        Read Until a Given Byte-String is Found, or Until Timeout.
+
+        Parameters
+        ----------
+        match:      bytes
+                    Byte-string which terminates the read.
+        timeout:    float, optional
+                    Maximum time (in seconds) to wait, waits indefinitely when
+                    not specified.
+
+        Returns
+        -------
+        bytes:      Data up to and including `match`, or whatever data was
+                    available when the timeout elapsed or the connection closed.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        decoder = self._decoder
+        scan_from = 0
+        while True:
+            data = decoder.take_until(match, scan_from)
+            if data is not None:
+                return data
+            scan_from = max(0, len(decoder.cooked) - len(match) + 1)
+            remaining = None
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+            if not self._fill(remaining):
+                break
+        return decoder.take(len(decoder.cooked))
+
+    def read_very_eager(self):
+        """Read all Data Available Without Blocking."""
+        while self._fill(0):
+            pass
+        return self._decoder.take(len(self._decoder.cooked))
@@ -7,7 +7,9 @@ Supports:
     - SEL Fast Message
     - SEL Fast Operate
 
-To use `telnetlib_support`, without importing `selprotopy` directly, use:
+`SELTelnet` is a `telnetlib.Telnet` which retains these null characters,
+leaving every other `Telnet` instance in the process untouched. To patch
+`telnetlib` globally instead, use:
 
 ```
 telnetlib.Telnet.process_rawq = process_rawq
@@ -29,19 +31,21 @@ def process_rawq(self):
     buf = [b'', b'']
     try:
         while self.rawq:
-            c = self.rawq_getchar()
             if not self.iacseq:
-                # Retain the Null Character
-                # if c == theNULL:
-                    # continue
-                # if c == b"\021":
-                    # continue
-                if c != IAC:
-                    buf[self.sb] = buf[self.sb] + c
+                # Retain the Null Character, Copying the Whole Run of Data up
+                # to the Next IAC at Once Rather than a Byte at a Time
+                index = self.rawq.find(IAC, self.irawq)
+                if index == -1:
+                    buf[self.sb] = buf[self.sb] + self.rawq[self.irawq:]
+                    self.rawq = b''
+                    self.irawq = 0
                     continue
-                else:
-                    self.iacseq += c
-            elif len(self.iacseq) == 1:
+                buf[self.sb] = buf[self.sb] + self.rawq[self.irawq:index]
+                self.irawq = index
+                self.iacseq += self.rawq_getchar()
+                continue
+            c = self.rawq_getchar()
+            if len(self.iacseq) == 1:
                 # 'IAC: IAC CMD [OPTION only for WILL/WONT/DO/DONT]'
                 if c in (DO, DONT, WILL, WONT):
                     self.iacseq += c
@@ -92,4 +96,10 @@ def process_rawq(self):
     self.cookedq = self.cookedq + buf[0]
     self.sbdataq = self.sbdataq + buf[1]
 
+
+class SELTelnet(telnetlib.Telnet):
+    """`telnetlib.Telnet` Connection which Retains the Null Characters."""
+
+    process_rawq = process_rawq
+
 # END
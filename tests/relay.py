@@ -0,0 +1,175 @@
+################################################################################
+"""
+selprotopy: A Protocol Binding Suite for the SEL Protocol Suite.
+
+Supports:
+    - SEL Fast Meter
+    - SEL Fast Message
+    - SEL Fast Operate
+
+Author(s):
+    - Joe Stanley: engineerjoe440@yahoo.com
+
+Homepage: https://github.com/engineerjoe440/sel-proto-py
+
+SEL Protocol Application Guide: https://selinc.com/api/download/5026/
+"""
+################################################################################
+
+# Standard Imports
+import socket
+import struct
+import threading
+
+
+# Frame a Binary Message: Fill in its Length and Append its Checksum
+def _framed(body: list):
+    message = bytearray(body)
+    message[2] = len(message) + 1
+    message.append(sum(message) & 0xff)
+    return bytes(message)
+
+
+# Quote a Line of an ASCII Block, Followed by its Checksum
+def _ascii_line(text: str):
+    line = f'"{text}",'
+    return f'{line}"{sum(map(ord, line)):04X}"'.encode()
+
+
+# Relay Definition: One Fast Meter Message, and Fast Operate Support
+RELAY_DEFINITION = _framed([
+    0xA5, 0xC0, 0, 1, 1, 0, 0xA5, 0xC1, 0xA5, 0xD1, 0, 0x01, 0x00,
+])
+
+# Fast Meter Configuration: Two Single-Precision Analogs (IA, VA)
+FAST_METER_CONFIGURATION = _framed(
+    [0xA5, 0xC1, 0, 1, 0, 0, 2, 1, 1, 0, 0, 4, 0, 0, 0, 12]
+    + list(b'IA\x00\x00\x00\x00') + [1, 255, 0, 0]
+    + list(b'VA\x00\x00\x00\x00') + [1, 255, 0, 0]
+)
+
+# Fast Meter Data: IA = 1.5, VA = 120.25, and One Byte of Digitals
+FAST_METER = _framed(
+    [0xA5, 0xD1, 0, 0]
+    + list(struct.pack('>f', 1.5)) + list(struct.pack('>f', 120.25))
+    + [0b10100000]
+)
+
+# Fast Operate Configuration: One Breaker, Two Remote Bits
+FAST_OPERATE_CONFIGURATION = _framed([
+    0xA5, 0xCE, 0, 1, 0, 2, 1, 0, 0x31, 0x32, 0x00, 0x20, 0x40, 0x01, 0x21,
+    0x41,
+])
+
+ID_BLOCK = b'\r\n'.join(_ascii_line(text) for text in (
+    'FID=SEL-351-R123-V0-Z100100-D20200101',
+    'BFID=SLBT-3CF1-R100-V0-Z100100-D20200101',
+    'CID=ABCD',
+    'DEVID=FEEDER 1',
+    'DEVCODE=42',
+    'PARTNO=0351X1234',
+    'CONFIG=11210',
+    'SPECIAL=0',
+)) + b'\r\n'
+
+DNA_BLOCK = _ascii_line(
+    'TLED","*","TRIP","*","50P1","*","IN101","*'
+) + b'\r\n'
+
+PASSWORDS = {b'ACC': b'OTTER', b'2AC': b'TAIL'}
+
+
+class FakeRelay(threading.Thread):
+    """
+    Minimal SEL Relay Answering over One End of a Socket Pair.
+
+    Parameters
+    ----------
+    dirty_prompts:  int, optional
+                    Number of prompt requests (from the start) answered with
+                    an unclean prompt. Defaults to 0
+    telnet:         bool, optional
+                    Control to escape IAC characters in responses, as a
+                    telnet server does. Defaults to False
+
+    Attributes
+    ----------
+    client_socket:  socket.socket
+                    Socket through which a client reaches the relay.
+    received:       list
+                    Every line received from the client, in order.
+    """
+
+    def __init__(self, dirty_prompts: int = 0, telnet: bool = False):
+        """Start the Relay."""
+        super().__init__(daemon=True)
+        self.client_socket, self._socket = socket.socketpair()
+        self.received = []
+        self.level = 0
+        self.dirty_prompts = dirty_prompts
+        self.telnet = telnet
+        self._awaiting_password = None
+        self.start()
+
+    def close(self):
+        """Close Both Ends of the Connection."""
+        self.client_socket.close()
+        self._socket.close()
+
+    def _prompt(self):
+        if self.dirty_prompts:
+            self.dirty_prompts -= 1
+            return b'Busy='
+        return b'\r\n' + {0: b'=', 1: b'=>', 2: b'=>>'}[self.level]
+
+    def run(self):
+        """Answer Each Line Received."""
+        pending = b''
+        while True:
+            try:
+                data = self._socket.recv(4096)
+            except OSError:
+                return
+            if not data:
+                return
+            pending += data
+            while b'\r\n' in pending:
+                line, pending = pending.split(b'\r\n', 1)
+                self.received.append(line)
+                response = self._respond(line)
+                if self.telnet:
+                    response = response.replace(b'\xff', b'\xff\xff')
+                try:
+                    self._socket.sendall(response)
+                except OSError:
+                    return
+
+    def _respond(self, line: bytes):
+        if self._awaiting_password is not None:
+            command, self._awaiting_password = self._awaiting_password, None
+            if line != PASSWORDS[command]:
+                return b'\r\nInvalid Password' + self._prompt()
+            self.level = 1 if command == b'ACC' else 2
+            return b'\r\nLevel %d' % self.level + self._prompt()
+        if line == b'':
+            return self._prompt()
+        if line == b'QUI':
+            self.level = 0
+            return b'QUI\r\n' + self._prompt()
+        if line in PASSWORDS:
+            self._awaiting_password = line
+            return line + b'\r\nPassword: ? '
+        blocks = {
+            b'ID': b'ID\r\n' + ID_BLOCK,
+            b'DNA': b'DNA\r\n' + DNA_BLOCK,
+            b'\xa5\xc0': RELAY_DEFINITION,
+            b'\xa5\xc1': FAST_METER_CONFIGURATION,
+            b'\xa5\xd1': FAST_METER,
+            b'\xa5\xce': FAST_OPERATE_CONFIGURATION,
+        }
+        if line in blocks:
+            return blocks[line] + self._prompt()
+        return line + b'\r\nInvalid Command' + self._prompt()
+
+
+# END
@@ -0,0 +1,152 @@
+################################################################################
+"""
+selprotopy: A Protocol Binding Suite for the SEL Protocol Suite.
+
+Supports:
+    - SEL Fast Meter
+    - SEL Fast Message
+    - SEL Fast Operate
+
+Author(s):
+    - Joe Stanley: engineerjoe440@yahoo.com
+
+Homepage: https://github.com/engineerjoe440/sel-proto-py
+
+SEL Protocol Application Guide: https://selinc.com/api/download/5026/
+"""
+################################################################################
+
+import socket
+import asyncio
+
+import pytest
+
+from selprotopy import exceptions
+from selprotopy.client.base import SELClient
+from selprotopy.client.aio import AsyncSELClient
+
+from tests.relay import FakeRelay
+
+PROMPT_REQUESTS_PER_BATCH = 3
+
+# Time to Wait for each Prompt from a Relay Answering with Unclean Prompts
+DIRTY_TIMEOUT = 0.1
+
+
+@pytest.fixture
+def relay():
+    relay = FakeRelay()
+    yield relay
+    relay.close()
+
+
+@pytest.fixture
+def telnet_relay():
+    relay = FakeRelay(telnet=True)
+    yield relay
+    relay.close()
+
+
+def test_verify_quit_and_access_level(relay):
+    client = SELClient(relay.client_socket, timeout=2)
+    assert relay.received[:4] == [b'', b'', b'', b'QUI']
+    assert client.access_level() == (0, '')
+    assert client.access_level_1(level_1_pass=b'OTTER')
+    assert client.access_level(refresh=True) == (1, 'ACC')
+    assert client.access_level_2(level_2_pass=b'TAIL')
+    assert client.access_level(refresh=True) == (2, '2AC')
+    client.quit()
+    assert client.access_level(refresh=True) == (0, '')
+
+
+def test_wrong_password(relay):
+    client = SELClient(relay.client_socket, timeout=2)
+    assert not client.access_level_1(level_1_pass=b'BEAVER')
+    assert client.access_level(refresh=True) == (0, '')
+
+
+def test_verify_fails_without_prompt():
+    client_socket, silent_socket = socket.socketpair()
+    with client_socket, silent_socket:
+        with pytest.raises(exceptions.ConnVerificationFail):
+            SELClient(client_socket, verify_timeout=0.1)
+
+
+def test_poll_fast_meter_leaves_debug_unchanged(relay):
+    client = SELClient(relay.client_socket, timeout=2, autoconfig=True)
+    assert client.debug is False
+    data = client.poll_fast_meter()
+    assert client.debug is False
+    assert data['analogs'] == {'IA': 1.5, 'VA': 120.25}
+
+
+async def _connect(relay, timeout=2, **kwargs):
+    reader, writer = await asyncio.open_connection(sock=relay.client_socket)
+    return AsyncSELClient(reader, writer, timeout=timeout, **kwargs)
+
+
+def test_async_verify_quit_and_access_level(telnet_relay):
+    relay = telnet_relay
+    async def exchange():
+        client = await _connect(relay)
+        assert await client._verify_connection()
+        await client.quit()
+        assert await client.access_level() == (0, '')
+        assert await client.access_level_1(level_1_pass=b'OTTER')
+        assert await client.access_level(refresh=True) == (1, 'ACC')
+        await client.quit()
+        assert await client.access_level(refresh=True) == (0, '')
+        await client.close()
+    asyncio.run(exchange())
+
+
+def test_async_autoconfig_and_poll(telnet_relay):
+    relay = telnet_relay
+    async def exchange():
+        client = await _connect(relay)
+        await client.autoconfig()
+        data = await client.poll_fast_meter()
+        await client.close()
+        return client, data
+    client, data = asyncio.run(exchange())
+    assert client.fid == 'SEL-351-R123-V0-Z100100-D20200101'
+    assert data['analogs'] == {'IA': 1.5, 'VA': 120.25}
+
+
+def test_async_quit_waits_for_clean_prompt():
+    # The QUIT Prompt and the First Batch of Prompts are Unclean (so each
+    # Read Waits Out the Timeout)
+    relay = FakeRelay(dirty_prompts=1 + PROMPT_REQUESTS_PER_BATCH)
+    async def exchange():
+        client = await _connect(relay, timeout=DIRTY_TIMEOUT)
+        await client.quit()
+        await client.close()
+    asyncio.run(exchange())
+    relay.close()
+    assert relay.received.count(b'') == 2 * PROMPT_REQUESTS_PER_BATCH
+
+
+def test_clean_prompt_wait_is_bounded():
+    relay = FakeRelay(dirty_prompts=100)
+    with pytest.raises(exceptions.ConnVerificationFail):
+        SELClient(relay.client_socket, timeout=DIRTY_TIMEOUT, noverify=True,
+                  conn_check=2)
+    relay.close()
+    assert relay.received.count(b'') == 2 * PROMPT_REQUESTS_PER_BATCH
+
+
+def test_async_clean_prompt_wait_is_bounded():
+    relay = FakeRelay(dirty_prompts=100)
+    async def exchange():
+        client = await _connect(relay, timeout=DIRTY_TIMEOUT, conn_check=2)
+        try:
+            await client.quit()
+        finally:
+            await client.close()
+    with pytest.raises(exceptions.ConnVerificationFail):
+        asyncio.run(exchange())
+    relay.close()
+    assert relay.received.count(b'') == 2 * PROMPT_REQUESTS_PER_BATCH
+
+
+# END
@@ -0,0 +1,76 @@
+################################################################################
+"""
+selprotopy: A Protocol Binding Suite for the SEL Protocol Suite.
+
+Supports:
+    - SEL Fast Meter
+    - SEL Fast Message
+    - SEL Fast Operate
+
+Author(s):
+    - Joe Stanley: engineerjoe440@yahoo.com
+
+Homepage: https://github.com/engineerjoe440/sel-proto-py
+
+SEL Protocol Application Guide: https://selinc.com/api/download/5026/
+"""
+################################################################################
+
+from selprotopy.support.socket import (
+    TelnetDecoder, IAC, DO, DONT, WILL, WONT, SB, SE,
+)
+
+ECHO = bytes([1])
+TERMINAL_TYPE = bytes([24])
+
+# Data, an Escaped IAC, a Refused DO and WILL, and a Subnegotiation (whose
+# Contents, Including an Escaped IAC, are Discarded)
+STREAM = (
+    b'=>' + IAC + IAC + b'\x00A5'
+    + IAC + DO + ECHO + b'\r\n'
+    + IAC + WILL + TERMINAL_TYPE
+    + IAC + SB + TERMINAL_TYPE + b'\x01VT' + IAC + IAC + b'100' + IAC + SE
+    + b'=>>'
+)
+COOKED = b'=>' + IAC + b'\x00A5\r\n=>>'
+REPLIES = IAC + WONT + ECHO + IAC + DONT + TERMINAL_TYPE
+
+
+def _decode(chunks):
+    decoder = TelnetDecoder()
+    replies = b''.join(decoder.feed(chunk) for chunk in chunks)
+    return bytes(decoder.cooked), replies
+
+
+def test_whole_stream():
+    assert _decode([STREAM]) == (COOKED, REPLIES)
+
+
+def test_every_split():
+    # Split the Stream in Two at Every Offset, Cutting Each Sequence
+    for split in range(1, len(STREAM)):
+        chunks = [STREAM[:split], STREAM[split:]]
+        assert _decode(chunks) == (COOKED, REPLIES), split
+
+
+def test_byte_at_a_time():
+    chunks = [STREAM[i:i+1] for i in range(len(STREAM))]
+    assert _decode(chunks) == (COOKED, REPLIES)
+
+
+def test_escaped_iac_split():
+    decoder = TelnetDecoder()
+    assert decoder.feed(b'a' + IAC) == b''
+    assert decoder.feed(IAC + b'b') == b''
+    assert decoder.take_until(b'b') == b'a' + IAC + b'b'
+
+
+def test_negotiation_refused():
+    decoder = TelnetDecoder()
+    assert decoder.feed(IAC + DONT + ECHO + IAC + WONT + ECHO) == (
+        IAC + WONT + ECHO + IAC + DONT + ECHO
+    )
+    assert decoder.cooked == b''
+
+
+# END